@@ -1,9 +1,14 @@
 import os
+import sqlite3
+import threading
 from datetime import datetime
+from functools import lru_cache
 from zoneinfo import ZoneInfo
 
-from flask import Flask
+from flask import Flask, g, request
 from flask_sqlalchemy import SQLAlchemy
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
 from flask_login import LoginManager
 from authlib.integrations.flask_client import OAuth
 
@@ -14,6 +19,21 @@ oauth = OAuth()
 
 # NYC timezone
 NYC_TZ = ZoneInfo("America/New_York")
+UTC_TZ = ZoneInfo("UTC")
+
+_DEFAULT_DB_TEMPLATE = "sqlite:///{}/app.sqlite"
+
+
+@event.listens_for(Engine, "connect")
+def _configure_sqlite_connection(dbapi_connection, _connection_record):
+    """Use WAL journaling so readers do not block on the background writers."""
+    if not isinstance(dbapi_connection, sqlite3.Connection):
+        return
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.close()
 
 
 def get_nyc_now():
@@ -25,9 +45,12 @@ def utc_to_nyc(utc_dt):
     """Convert UTC datetime to NYC timezone."""
     if utc_dt is None:
         return None
-    if utc_dt.tzinfo is None:
+    tzinfo = utc_dt.tzinfo
+    if tzinfo is NYC_TZ:
+        return utc_dt
+    if tzinfo is None:
         # Assume UTC if no timezone info
-        utc_dt = utc_dt.replace(tzinfo=ZoneInfo("UTC"))
+        utc_dt = utc_dt.replace(tzinfo=UTC_TZ)
     return utc_dt.astimezone(NYC_TZ)
 
 
@@ -38,24 +61,51 @@ def nyc_to_utc(nyc_dt):
     if nyc_dt.tzinfo is None:
         # Assume NYC timezone if no timezone info
         nyc_dt = nyc_dt.replace(tzinfo=NYC_TZ)
-    return nyc_dt.astimezone(ZoneInfo("UTC"))
+    return nyc_dt.astimezone(UTC_TZ)
+
+
+@lru_cache(maxsize=8192)
+def _format_nyc_timestamp(ts_utc, format_str):
+    return datetime.fromtimestamp(ts_utc, UTC_TZ).astimezone(NYC_TZ).strftime(format_str)
 
 
 def format_nyc_datetime(dt, format_str="%Y-%m-%d %I:%M %p"):
     """Format datetime in NYC timezone."""
     if dt is None:
         return "—"
-    nyc_dt = utc_to_nyc(dt)
-    return nyc_dt.strftime(format_str)
+    if dt.tzinfo is None:
+        # Assume UTC if no timezone info
+        dt = dt.replace(tzinfo=UTC_TZ)
+    return _format_nyc_timestamp(dt.timestamp(), format_str)
+
+
+_DIRS_READY: set[str] = set()
+
+
+def _ensure_dir(path):
+    """Create ``path`` once per process; later app constructions skip the syscalls."""
+    if path in _DIRS_READY:
+        return
+    try:
+        os.makedirs(path, exist_ok=True)
+    except OSError:
+        return
+    _DIRS_READY.add(path)
+
+
+_STATIC_TEMPLATE_CONTEXT = {
+    "format_nyc_datetime": format_nyc_datetime,
+    "utc_to_nyc": utc_to_nyc,
+}
 
 
 def create_app(test_config=None):
     app = Flask(__name__)
-    app.config.from_mapping(
+    # Environment is read per app so settings exported after import still apply.
+    app.config.update(
         SECRET_KEY=os.environ.get("SECRET_KEY", "dev"),
-        SQLALCHEMY_DATABASE_URI=os.environ.get(
-            "DATABASE_URL", f"sqlite:///{os.path.join(app.instance_path, 'app.sqlite')}"
-        ),
+        SQLALCHEMY_DATABASE_URI=os.environ.get("DATABASE_URL")
+        or _DEFAULT_DB_TEMPLATE.format(app.instance_path),
         SQLALCHEMY_TRACK_MODIFICATIONS=False,
         GOOGLE_CLIENT_ID=os.environ.get("GOOGLE_CLIENT_ID", ""),
         GOOGLE_CLIENT_SECRET=os.environ.get("GOOGLE_CLIENT_SECRET", ""),
@@ -64,19 +114,13 @@ def create_app(test_config=None):
     if test_config is not None:
         app.config.update(test_config)
 
-    try:
-        os.makedirs(app.instance_path, exist_ok=True)
-    except OSError:
-        pass
+    _ensure_dir(app.instance_path)
 
     storage_path = app.config.get("TELESTRATIONS_STORAGE_PATH")
     if not storage_path:
         storage_path = os.path.join(app.instance_path, "telestrations")
         app.config["TELESTRATIONS_STORAGE_PATH"] = storage_path
-    try:
-        os.makedirs(storage_path, exist_ok=True)
-    except OSError:
-        pass
+    _ensure_dir(storage_path)
 
     db.init_app(app)
     login_manager.init_app(app)
@@ -96,39 +140,57 @@ def create_app(test_config=None):
     from .auth import bp as auth_bp
     from .routes import bp as main_bp
     from .securities import init_market
-    from .casino import init_casino
-    from .games import init_games
     from .economy import init_economy
 
-    app.register_blueprint(auth_bp)
-    app.register_blueprint(main_bp)
+    for blueprint in (auth_bp, main_bp):
+        if blueprint.name not in app.blueprints:
+            app.register_blueprint(blueprint)
 
     register_cli_commands(app)
     init_market(app)
-    init_casino(app)
-    init_games(app)
     init_economy(app)
+    register_lazy_subsystems(app)
 
     @app.context_processor
-    def inject_now():
-        return {"now": get_nyc_now()}
+    def inject_template_context():
+        # Resolve "now" once per request so included templates share it.
+        now = getattr(g, "_nyc_now", None)
+        if now is None:
+            now = g._nyc_now = get_nyc_now()
+        return {**_STATIC_TEMPLATE_CONTEXT, "now": now, "request": request}
 
-    @app.context_processor
-    def inject_timezone_utils():
-        return {
-            "format_nyc_datetime": format_nyc_datetime,
-            "utc_to_nyc": utc_to_nyc,
-        }
+    return app
 
-    @app.context_processor
-    def inject_request():
-        from flask import request
-        return {"request": request}
 
-    return app
+def register_lazy_subsystems(app):
+    """Defer casino, games and economy flusher setup until the first request is served."""
+    app.extensions.setdefault("casino_booted", False)
+    boot_lock = threading.Lock()
+
+    @app.before_request
+    def _boot_casino() -> None:
+        if app.extensions["casino_booted"]:
+            return
+        with boot_lock:
+            if app.extensions["casino_booted"]:
+                return
+            from .casino import init_casino
+            from .economy import get_economy_manager
+            from .games import init_games
+
+            init_casino(app).start()
+            init_games(app)
+            economy = get_economy_manager()
+            if economy is not None:
+                economy.start()
+            app.extensions["casino_booted"] = True
 
 
 def register_cli_commands(app):
+    # Only the ``flask`` CLI needs these; REGISTER_CLI forces the choice either way.
+    if not app.config.get("REGISTER_CLI", os.environ.get("FLASK_RUN_FROM_CLI") == "true"):
+        return
+
     @app.cli.command("init-db")
     def init_db_command():
         """Clear existing data and create new tables."""
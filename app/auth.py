@@ -1,5 +1,8 @@
+import time
+
 from flask import Blueprint, flash, redirect, render_template, request, session, url_for
 from flask_login import current_user, login_required, login_user, logout_user
+from sqlalchemy.exc import IntegrityError
 
 from . import db, oauth
 from .models import Role, User
@@ -8,17 +11,56 @@ from .models import Role, User
 bp = Blueprint("auth", __name__, url_prefix="/auth")
 
 
+_GOOGLE = None
+
+
 def require_oauth():
-    provider = oauth.create_client("google") if "google" in oauth._clients else None
-    if provider is None:
-        flash(
-            "Google OAuth is not configured. Set GOOGLE_CLIENT_ID and GOOGLE_CLIENT_SECRET.",
-            "error",
-        )
-        return False
+    global _GOOGLE
+    if _GOOGLE is None:
+        if "google" not in oauth._clients:
+            flash(
+                "Google OAuth is not configured. Set GOOGLE_CLIENT_ID and GOOGLE_CLIENT_SECRET.",
+                "error",
+            )
+            return False
+        _GOOGLE = oauth.create_client("google")
     return True
 
 
+def google_client():
+    return _GOOGLE
+
+
+GUEST_GOOGLE_ID = "guest"
+_USER_ID_CACHE_SIZE = 256
+_USER_ID_CACHE_TTL = 300.0
+# google_id -> (user id, monotonic expiry); insertion order doubles as age order.
+_USER_ID_BY_GOOGLE: dict[str, tuple[int, float]] = {}
+
+
+def _remember_user_id(google_id, user_id):
+    now = time.monotonic()
+    _USER_ID_BY_GOOGLE.pop(google_id, None)
+    while _USER_ID_BY_GOOGLE:
+        oldest = next(iter(_USER_ID_BY_GOOGLE))
+        if len(_USER_ID_BY_GOOGLE) < _USER_ID_CACHE_SIZE and _USER_ID_BY_GOOGLE[oldest][1] > now:
+            break
+        _USER_ID_BY_GOOGLE.pop(oldest, None)
+    _USER_ID_BY_GOOGLE[google_id] = (user_id, now + _USER_ID_CACHE_TTL)
+
+
+def _find_user_by_google_id(google_id):
+    entry = _USER_ID_BY_GOOGLE.get(google_id)
+    if entry is not None and entry[1] > time.monotonic():
+        user = db.session.get(User, entry[0])
+        if user is not None and user.google_id == google_id:
+            return user
+    user = User.query.filter_by(google_id=google_id).first()
+    if user is not None:
+        _remember_user_id(google_id, user.id)
+    return user
+
+
 @bp.route("/login")
 def login():
     if current_user.is_authenticated:
@@ -26,17 +68,17 @@ def login():
     if not require_oauth():
         return render_template("login.html", allow_guest=True)
     redirect_uri = url_for("auth.authorize", _external=True, _scheme="https")
-    return oauth.google.authorize_redirect(redirect_uri)
+    return google_client().authorize_redirect(redirect_uri)
 
 
 @bp.route("/authorize")
 def authorize():
     if not require_oauth():
         return redirect(url_for("main.index"))
-    token = oauth.google.authorize_access_token()
+    token = google_client().authorize_access_token()
     user_info = token.get("userinfo")
     if not user_info:
-        user_info = oauth.google.parse_id_token(token)
+        user_info = google_client().parse_id_token(token)
     if user_info is None:
         flash("Unable to fetch user information from Google.", "error")
         return redirect(url_for("main.index"))
@@ -45,11 +87,12 @@ def authorize():
     email = user_info.get("email")
     name = user_info.get("name") or email
 
-    user = User.query.filter_by(google_id=google_id).first()
+    user = _find_user_by_google_id(google_id)
     if not user:
         user = User(google_id=google_id, email=email, name=name, role=Role.PLAYER)
         db.session.add(user)
         db.session.commit()
+        _remember_user_id(google_id, user.id)
 
     login_user(user)
     session["token"] = token
@@ -66,21 +109,33 @@ def logout():
     return redirect(url_for("main.index"))
 
 
+def _get_or_create_guest():
+    user = _find_user_by_google_id(GUEST_GOOGLE_ID)
+    if user:
+        return user
+    user = User(
+        google_id=GUEST_GOOGLE_ID,
+        email="guest@example.com",
+        name="Guest",
+        role=Role.PLAYER,
+    )
+    db.session.add(user)
+    try:
+        db.session.commit()
+    except IntegrityError:
+        # A concurrent guest login created the row first; reuse it.
+        db.session.rollback()
+        return _find_user_by_google_id(GUEST_GOOGLE_ID)
+    _remember_user_id(GUEST_GOOGLE_ID, user.id)
+    return user
+
+
 @bp.route("/guest-login", methods=["POST"])
 def guest_login():
     if current_user.is_authenticated:
         return redirect(url_for("main.dashboard"))
 
-    user = User.query.filter_by(google_id="guest").first()
-    if not user:
-        user = User(
-            google_id="guest",
-            email="guest@example.com",
-            name="Guest",
-            role=Role.PLAYER,
-        )
-        db.session.add(user)
-        db.session.commit()
+    user = _get_or_create_guest()
 
     login_user(user)
     session["token"] = {"userinfo": {"name": user.name}}
@@ -1,21 +1,15 @@
 """Casino games, configuration, and earnings publication utilities."""
 from __future__ import annotations
 
+import os
 import random
 import threading
-import time
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
-
-try:  # Python 3.11+
-    import tomllib  # type: ignore[attr-defined]
-except ModuleNotFoundError:  # pragma: no cover - defensive fallback
-    import tomli as tomllib  # type: ignore
+from typing import Dict, List, Optional, Sequence, Tuple
 
 from flask import current_app, has_app_context
-from sqlalchemy.orm import joinedload
 
 try:
     from . import db, get_nyc_now
@@ -46,6 +40,54 @@ LAST_PUBLISH_KEY = "casino:last_publish_at"
 SUMMARY_KEY = "casino:last_publish_summary"
 CASINO_SYMBOL = "CT"
 
+SlotLine = Tuple[str, int, Tuple[Tuple[int, int], ...]]
+
+# Every paying line on the 3x3 grid as (line_type, index, (col, row) coordinates).
+_SLOT_LINES: Tuple[SlotLine, ...] = (
+    ("row", 0, ((0, 0), (1, 0), (2, 0))),
+    ("row", 1, ((0, 1), (1, 1), (2, 1))),
+    ("row", 2, ((0, 2), (1, 2), (2, 2))),
+    ("column", 0, ((0, 0), (0, 1), (0, 2))),
+    ("column", 1, ((1, 0), (1, 1), (1, 2))),
+    ("column", 2, ((2, 0), (2, 1), (2, 2))),
+    ("diagonal", 0, ((0, 0), (1, 1), (2, 2))),
+    ("diagonal", 1, ((2, 0), (1, 1), (0, 2))),
+)
+# Each line paired with its cell offsets in the column-major flattened grid,
+# so evaluation compares flat list items instead of nested reel lookups.
+_INDEXED_SLOT_LINES: Tuple[Tuple[Tuple[int, int, int], SlotLine], ...] = tuple(
+    (tuple(col * 3 + row for col, row in line[2]), line) for line in _SLOT_LINES
+)
+
+# Blackjack card ranks and their values with aces counted high.
+_CARD_VALUE: Dict[str, int] = {
+    "A": 11,
+    "2": 2,
+    "3": 3,
+    "4": 4,
+    "5": 5,
+    "6": 6,
+    "7": 7,
+    "8": 8,
+    "9": 9,
+    "10": 10,
+    "J": 10,
+    "Q": 10,
+    "K": 10,
+}
+_BLACKJACK_DECK: Tuple[str, ...] = tuple(_CARD_VALUE)
+
+
+def _add_card(total: int, aces: int, card: str) -> Tuple[int, int]:
+    """Add ``card`` to a hand's running total, counting aces low while it would bust."""
+    total += _CARD_VALUE[card]
+    if card == "A":
+        aces += 1
+    while total > 21 and aces:
+        total -= 10
+        aces -= 1
+    return total, aces
+
 
 @dataclass
 class SlotPrize:
@@ -70,10 +112,13 @@ class SlotMachine:
     theme: str
     prizes: List[SlotPrize]
     payout_rate: float = 0.95
+    # Derived from ``prizes`` once at construction; prizes are not mutated afterwards.
+    symbols: List[str] = field(init=False, repr=False, compare=False)
+    prize_lookup: Dict[str, SlotPrize] = field(init=False, repr=False, compare=False)
 
-    @property
-    def symbols(self) -> List[str]:
-        return [prize.symbol for prize in self.prizes]
+    def __post_init__(self) -> None:
+        self.symbols = [prize.symbol for prize in self.prizes]
+        self.prize_lookup = {prize.symbol: prize for prize in self.prizes}
 
     def serialize_prizes(self) -> List[Dict[str, object]]:
         return [prize.to_dict() for prize in self.prizes]
@@ -83,7 +128,7 @@ class SlotMachine:
 class SlotLineWin:
     line_type: str
     index: int
-    coordinates: List[Tuple[int, int]]
+    coordinates: Sequence[Tuple[int, int]]
     prize: SlotPrize
     payout: float
 
@@ -124,18 +169,26 @@ class CasinoManager:
     """Orchestrates casino games and dividend logic for Casino Technologies."""
 
     publish_interval = timedelta(minutes=20)
+    # Parsed config and built slot machines keyed by (path, mtime_ns, size).
+    _config_cache: Dict[Tuple[str, int, int], Tuple[dict, Dict[str, SlotMachine]]] = {}
 
     def __init__(self, app, config_path: Path):
         self.app = app
         self.config_path = config_path
-        self._lock = threading.Lock()
         self._thread: Optional[threading.Thread] = None
         self._stop = threading.Event()
+        self._publish_now = threading.Event()
+        self._publish_done = threading.Condition()
+        self._forced_requested = 0
+        self._forced_served = 0
+        self._forced_summary: Optional[str] = None
+        self._forced_error: Optional[BaseException] = None
         self.slots: Dict[str, SlotMachine] = {}
         self.blackjack_min_bet: float = 5.0
         self.blackjack_max_bet: float = 250.0
         self.blackjack_payout: float = 1.5
         self._pending_profit: float = 0.0
+        self._pending_dirty = False
         self._last_publish: Optional[datetime] = None
         self.reload_config()
         self._load_state()
@@ -143,14 +196,52 @@ class CasinoManager:
     # ------------------------------------------------------------------
     # Configuration
     def reload_config(self) -> None:
-        defaults = self._default_slots()
-        data = {}
+        path_key = str(self.config_path)
         try:
-            with self.config_path.open("rb") as handle:
-                data = tomllib.load(handle)
+            stat = os.stat(self.config_path)
+            cache_key = (path_key, stat.st_mtime_ns, stat.st_size)
         except FileNotFoundError:
-            data = {}
+            cache_key = (path_key, -1, -1)
+
+        cached = self._config_cache.get(cache_key)
+        if cached is None:
+            try:
+                raw = self.config_path.read_bytes()
+            except FileNotFoundError:
+                data = {}
+            else:
+                # Imported lazily: most processes parse this file once, if at all.
+                try:  # Python 3.11+
+                    import tomllib  # type: ignore[attr-defined]
+                except ModuleNotFoundError:  # pragma: no cover - defensive fallback
+                    import tomli as tomllib  # type: ignore
+                data = tomllib.loads(raw.decode("utf-8"))
+            cached = (data, self._build_slots(data))
+            for stale_key in [key for key in self._config_cache if key[0] == path_key]:
+                del self._config_cache[stale_key]
+            self._config_cache[cache_key] = cached
+        data, slots = cached
+        self.slots = dict(slots)
 
+        blackjack_cfg = data.get("blackjack", {}) if isinstance(data.get("blackjack"), dict) else {}
+        try:
+            self.blackjack_min_bet = max(0.01, float(blackjack_cfg.get("min_bet", 5.0)))
+        except (TypeError, ValueError):
+            self.blackjack_min_bet = 5.0
+        try:
+            self.blackjack_max_bet = max(
+                self.blackjack_min_bet,
+                float(blackjack_cfg.get("max_bet", 250.0)),
+            )
+        except (TypeError, ValueError):
+            self.blackjack_max_bet = max(self.blackjack_min_bet, 250.0)
+        try:
+            self.blackjack_payout = max(1.0, float(blackjack_cfg.get("blackjack_payout", 1.5)))
+        except (TypeError, ValueError):
+            self.blackjack_payout = 1.5
+
+    def _build_slots(self, data: dict) -> Dict[str, SlotMachine]:
+        defaults = self._default_slots()
         payouts_cfg = data.get("payouts", {})
         default_slot_rate = float(payouts_cfg.get("default_slot", 0.95))
         slot_overrides = data.get("slots", {})
@@ -228,24 +319,7 @@ class CasinoManager:
                 prizes=prizes,
                 payout_rate=max(0.0, min(0.999, payout)),
             )
-        self.slots = slots
-
-        blackjack_cfg = data.get("blackjack", {}) if isinstance(data.get("blackjack"), dict) else {}
-        try:
-            self.blackjack_min_bet = max(0.01, float(blackjack_cfg.get("min_bet", 5.0)))
-        except (TypeError, ValueError):
-            self.blackjack_min_bet = 5.0
-        try:
-            self.blackjack_max_bet = max(
-                self.blackjack_min_bet,
-                float(blackjack_cfg.get("max_bet", 250.0)),
-            )
-        except (TypeError, ValueError):
-            self.blackjack_max_bet = max(self.blackjack_min_bet, 250.0)
-        try:
-            self.blackjack_payout = max(1.0, float(blackjack_cfg.get("blackjack_payout", 1.5)))
-        except (TypeError, ValueError):
-            self.blackjack_payout = 1.5
+        return slots
 
     def _default_slots(self) -> Dict[str, SlotMachine]:
         return {
@@ -294,24 +368,44 @@ class CasinoManager:
     # State helpers
     def _load_state(self) -> None:
         with self.app.app_context():
+            # Create missing tables once here so setting reads stay plain SELECTs.
+            db.create_all()
             self._pending_profit = self._get_setting_float(PENDING_KEY, 0.0)
             self._last_publish = self._get_setting_datetime(LAST_PUBLISH_KEY)
 
     def _get_setting(self, key: str) -> Optional[AppSetting]:
-        try:
-            return AppSetting.query.filter_by(key=key).first()
-        except Exception:
-            db.create_all()
-            return AppSetting.query.filter_by(key=key).first()
-
-    def _set_setting(self, key: str, value: str, commit: bool = False) -> None:
+        return AppSetting.query.filter_by(key=key).first()
+
+    def _get_settings_bulk(self, keys: List[str]) -> Dict[str, AppSetting]:
+        rows = AppSetting.query.filter(AppSetting.key.in_(keys)).all()
+        return {row.key: row for row in rows}
+
+    def _set_settings_bulk(
+        self, values: Dict[str, str], now: Optional[datetime] = None
+    ) -> None:
+        existing = self._get_settings_bulk(list(values))
+        if now is None:
+            now = datetime.utcnow()
+        for key, value in values.items():
+            setting = existing.get(key)
+            if setting is None:
+                db.session.add(AppSetting(key=key, value=value, updated_at=now))
+            else:
+                setting.value = value
+                setting.updated_at = now
+
+    def _set_setting(
+        self, key: str, value: str, commit: bool = False, now: Optional[datetime] = None
+    ) -> None:
+        if now is None:
+            now = datetime.utcnow()
         setting = self._get_setting(key)
         if setting is None:
-            setting = AppSetting(key=key, value=value, updated_at=datetime.utcnow())
+            setting = AppSetting(key=key, value=value, updated_at=now)
             db.session.add(setting)
         else:
             setting.value = value
-            setting.updated_at = datetime.utcnow()
+            setting.updated_at = now
         if commit:
             db.session.commit()
 
@@ -335,12 +429,21 @@ class CasinoManager:
 
     def _set_pending_profit(self, value: float, commit: bool = False) -> None:
         self._pending_profit = value
-        self._set_setting(PENDING_KEY, f"{value:.6f}", commit=commit)
+        if not commit:
+            # Games only touch memory; publication or stop() persists the total.
+            self._pending_dirty = True
+            return
+        self._set_setting(PENDING_KEY, f"{value:.6f}", commit=True)
+        self._pending_dirty = False
 
-    def _set_last_publish(self, when: datetime, summary: str, commit: bool = False) -> None:
-        self._last_publish = when
-        self._set_setting(LAST_PUBLISH_KEY, when.isoformat(), commit=False)
-        self._set_setting(SUMMARY_KEY, summary, commit=commit)
+    def _flush_pending_profit(self) -> None:
+        if not self._pending_dirty:
+            return
+        with self.app.app_context():
+            try:
+                self._set_pending_profit(self._pending_profit, commit=True)
+            except Exception:
+                db.session.rollback()
 
     # ------------------------------------------------------------------
     # Accessors
@@ -373,23 +476,36 @@ class CasinoManager:
 
         slot = self.get_slot(key)
         symbol_choices = slot.symbols or ["❓"]
-        prize_lookup: Dict[str, SlotPrize] = {prize.symbol: prize for prize in slot.prizes}
+        prize_lookup = slot.prize_lookup
 
-        reels: List[List[str]] = []
-        for _ in range(3):
-            column = [random.choice(symbol_choices) for _ in range(3)]
-            reels.append(column)
+        flat = random.choices(symbol_choices, k=9)
+        reels: List[List[str]] = [flat[0:3], flat[3:6], flat[6:9]]
 
         win_probability = max(0.0, min(1.0, slot.payout_rate))
         wins = self._evaluate_slot_grid(reels, prize_lookup, wager)
         if not wins and random.random() < win_probability and slot.prizes:
             # Force a winning line to better align with the configured payout rate
             target_prize = random.choice(slot.prizes)
-            line_definitions = self._slot_line_definitions()
-            line_type, index, coordinates = random.choice(line_definitions)
+            position = random.randrange(len(_SLOT_LINES))
+            line_type, index, coordinates = _SLOT_LINES[position]
             for col, row in coordinates:
                 reels[col][row] = target_prize.symbol
-            wins = self._evaluate_slot_grid(reels, prize_lookup, wager)
+            forced_win = SlotLineWin(
+                line_type=line_type,
+                index=index,
+                coordinates=coordinates,
+                prize=target_prize,
+                payout=round(wager * target_prize.multiplier, 2),
+            )
+            # Re-evaluate every other line around the forced one so the wins keep the
+            # same order a full grid evaluation would produce.
+            wins = (
+                self._evaluate_slot_grid(reels, prize_lookup, wager, _INDEXED_SLOT_LINES[:position])
+                + [forced_win]
+                + self._evaluate_slot_grid(
+                    reels, prize_lookup, wager, _INDEXED_SLOT_LINES[position + 1 :]
+                )
+            )
 
         total_payout = sum(win.payout for win in wins)
         total_winnings = round(total_payout, 2)
@@ -420,14 +536,14 @@ class CasinoManager:
         reels: List[List[str]],
         prize_lookup: Dict[str, SlotPrize],
         wager: float,
+        lines: Sequence[Tuple[Tuple[int, int, int], SlotLine]] = _INDEXED_SLOT_LINES,
     ) -> List[SlotLineWin]:
         wins: List[SlotLineWin] = []
-        line_definitions = self._slot_line_definitions()
-        for line_type, index, coordinates in line_definitions:
-            symbols = [reels[col][row] for col, row in coordinates]
-            if len(set(symbols)) != 1:
+        cells = reels[0] + reels[1] + reels[2]
+        for (i0, i1, i2), (line_type, index, coordinates) in lines:
+            symbol = cells[i0]
+            if symbol != cells[i1] or symbol != cells[i2]:
                 continue
-            symbol = symbols[0]
             prize = prize_lookup.get(symbol)
             if not prize:
                 continue
@@ -444,17 +560,8 @@ class CasinoManager:
         return wins
 
     @staticmethod
-    def _slot_line_definitions() -> List[Tuple[str, int, List[Tuple[int, int]]]]:
-        lines: List[Tuple[str, int, List[Tuple[int, int]]]] = []
-        for row in range(3):
-            coords = [(col, row) for col in range(3)]
-            lines.append(("row", row, coords))
-        for col in range(3):
-            coords = [(col, row) for row in range(3)]
-            lines.append(("column", col, coords))
-        lines.append(("diagonal", 0, [(0, 0), (1, 1), (2, 2)]))
-        lines.append(("diagonal", 1, [(2, 0), (1, 1), (0, 2)]))
-        return lines
+    def _slot_line_definitions() -> Tuple[SlotLine, ...]:
+        return _SLOT_LINES
 
     def play_blackjack(self, wager: float) -> BlackjackResult:
         if wager <= 0:
@@ -464,45 +571,36 @@ class CasinoManager:
                 f"Blackjack wager must be between {self.blackjack_min_bet:.2f} and {self.blackjack_max_bet:.2f}."
             )
 
-        deck = ["A", "2", "3", "4", "5", "6", "7", "8", "9", "10", "J", "Q", "K"]
+        deck = _BLACKJACK_DECK
+
+        # Pre-draw (with replacement, as before) enough cards for almost any hand.
+        draws = iter(random.choices(deck, k=16))
 
         def draw_card() -> str:
-            return random.choice(deck)
-
-        def hand_value(cards: List[str]) -> int:
-            total = 0
-            aces = 0
-            for card in cards:
-                if card == "A":
-                    aces += 1
-                    total += 11
-                elif card in {"J", "Q", "K"}:
-                    total += 10
-                else:
-                    total += int(card)
-            while total > 21 and aces:
-                total -= 10
-                aces -= 1
-            return total
+            return next(draws, None) or random.choice(deck)
 
         player_cards = [draw_card(), draw_card()]
         dealer_cards = [draw_card(), draw_card()]
-        player_total = hand_value(player_cards)
-        dealer_total = hand_value(dealer_cards)
+        player_total, player_aces = _add_card(0, 0, player_cards[0])
+        player_total, player_aces = _add_card(player_total, player_aces, player_cards[1])
+        dealer_total, dealer_aces = _add_card(0, 0, dealer_cards[0])
+        dealer_total, dealer_aces = _add_card(dealer_total, dealer_aces, dealer_cards[1])
         natural_player = player_total == 21
         natural_dealer = dealer_total == 21
 
         if not natural_player:
             while player_total < 17:
-                player_cards.append(draw_card())
-                player_total = hand_value(player_cards)
+                card = draw_card()
+                player_cards.append(card)
+                player_total, player_aces = _add_card(player_total, player_aces, card)
                 if player_total > 21:
                     break
 
         if player_total <= 21:
             while dealer_total < 17:
-                dealer_cards.append(draw_card())
-                dealer_total = hand_value(dealer_cards)
+                card = draw_card()
+                dealer_cards.append(card)
+                dealer_total, dealer_aces = _add_card(dealer_total, dealer_aces, card)
 
         if player_total > 21:
             outcome = "bust"
@@ -534,10 +632,39 @@ class CasinoManager:
     # ------------------------------------------------------------------
     # Earnings publication
     def publish_earnings_if_due(self, *, force: bool = False) -> Optional[str]:
+        """Publish earnings when due, deferring to the background thread if it runs.
+
+        Only the publisher thread touches the publication state while it is
+        alive. Other callers just flag that a publication is wanted; forced
+        callers then wait for that publication and receive its summary.
+        """
+        thread = self._thread
+        if thread is None or not thread.is_alive() or threading.current_thread() is thread:
+            return self._publish_if_due(force=force)
+        if not force:
+            if self._should_publish(datetime.utcnow()):
+                self._publish_now.set()
+            return None
+
+        # Release this session's write lock; inline publication committed it anyway.
+        db.session.commit()
+        with self._publish_done:
+            self._forced_requested += 1
+            ticket = self._forced_requested
+            self._publish_now.set()
+            while self._forced_served < ticket and thread.is_alive():
+                self._publish_done.wait(timeout=1.0)
+            if self._forced_served >= ticket:
+                if self._forced_error is not None:
+                    raise self._forced_error
+                return self._forced_summary
+        # The publisher thread exited before serving the request.
+        return self._publish_if_due(force=True)
+
+    def _publish_if_due(self, *, force: bool = False) -> Optional[str]:
         now = datetime.utcnow()
-        with self._lock:
-            if force or self._should_publish(now):
-                return self._publish_earnings(now)
+        if force or self._should_publish(now):
+            return self._publish_earnings(now)
         return None
 
     def _should_publish(self, now: datetime) -> bool:
@@ -555,48 +682,70 @@ class CasinoManager:
                 summary = self._distribute_dividends(profit)
             else:
                 summary = self._cover_losses(-profit)
-            self._set_pending_profit(0.0, commit=False)
-            self._set_last_publish(now, summary, commit=False)
+            self._pending_profit = 0.0
+            self._pending_dirty = False
+            self._last_publish = now
+            self._set_settings_bulk(
+                {
+                    PENDING_KEY: f"{0.0:.6f}",
+                    LAST_PUBLISH_KEY: now.isoformat(),
+                    SUMMARY_KEY: summary,
+                },
+                now=now,
+            )
+            db.session.flush()
             db.session.commit()
         except Exception:
             db.session.rollback()
-            raise
-        finally:
+            # Tear down the scoped session only on failure; commit() has already returned
+            # the connection to the pool on success, so nothing stays pinned either way.
             db.session.remove()
+            raise
         return summary
 
     def _distribute_dividends(self, profit: float) -> str:
         dividend_pool = profit * 0.5
-        holdings = (
-            SecurityHolding.query.filter(
+        # Only (user_id, quantity) pairs are needed, so skip hydrating ORM holdings.
+        rows = db.session.execute(
+            db.select(SecurityHolding.user_id, SecurityHolding.quantity).where(
                 SecurityHolding.security_symbol == CASINO_SYMBOL,
                 SecurityHolding.quantity > 0,
             )
-            .options(joinedload(SecurityHolding.user))
-            .all()
-        )
-        total_shares = sum(float(h.quantity or 0.0) for h in holdings)
+        ).all()
+        shares_by_user: Dict[int, float] = {}
+        for user_id, quantity in rows:
+            shares_by_user[user_id] = shares_by_user.get(user_id, 0.0) + float(quantity or 0.0)
+        total_shares = sum(shares_by_user.values())
         if total_shares <= 0:
             return "Casino earned profit but no outstanding shares existed; retained earnings."
         per_share = dividend_pool / total_shares
-        for holding in holdings:
-            qty = float(holding.quantity or 0.0)
+        balance_updates: List[Dict[str, object]] = []
+        transactions: List[Dict[str, object]] = []
+        for user_id, qty in shares_by_user.items():
             if qty <= 0:
                 continue
             amount = qty * per_share
             if abs(amount) < 1e-6:
                 continue
-            user = holding.user or User.query.get(holding.user_id)
-            if not user:
-                continue
-            user.balance += amount
-            txn = Transaction(
-                user_id=user.id,
-                amount=amount,
-                description="Casino Technologies dividend",
-                type="dividend",
+            balance_updates.append({"holder_id": user_id, "credit": amount})
+            transactions.append(
+                {
+                    "user_id": user_id,
+                    "amount": amount,
+                    "description": "Casino Technologies dividend",
+                    "type": "dividend",
+                }
             )
-            db.session.add(txn)
+        if balance_updates:
+            # One executemany per table instead of a SELECT/UPDATE/INSERT per holder.
+            connection = db.session.connection()
+            connection.execute(
+                db.update(User)
+                .where(User.id == db.bindparam("holder_id"))
+                .values(balance=User.balance + db.bindparam("credit")),
+                balance_updates,
+            )
+            connection.execute(db.insert(Transaction), transactions)
         db.session.flush()
         return (
             f"Casino distributed {dividend_pool:.2f} credits in dividends at {per_share:.4f} per share."
@@ -627,35 +776,53 @@ class CasinoManager:
 
     def stop(self) -> None:
         self._stop.set()
+        self._publish_now.set()
         if self._thread and self._thread.is_alive():
             self._thread.join(timeout=1)
+        self._flush_pending_profit()
 
     def _run(self) -> None:  # pragma: no cover - background thread
         with self.app.app_context():
             while not self._stop.is_set():
-                start = time.monotonic()
+                # Clear before reading the request count so a request made
+                # mid-publication leaves the event set for the next pass.
+                self._publish_now.clear()
+                with self._publish_done:
+                    requested = self._forced_requested
+                forced = requested > self._forced_served
+                summary: Optional[str] = None
+                error: Optional[BaseException] = None
                 try:
-                    self.publish_earnings_if_due()
-                except Exception:
+                    summary = self._publish_if_due(force=forced)
+                except Exception as exc:
                     db.session.rollback()
-                elapsed = time.monotonic() - start
-                delay = max(30.0, 60.0 - elapsed)
-                time.sleep(delay)
+                    error = exc
+                with self._publish_done:
+                    if forced:
+                        self._forced_summary = summary
+                        self._forced_error = error
+                        self._forced_served = requested
+                    self._publish_done.notify_all()
+                # Sleep until the next publication is due; requests and stop() wake it early.
+                self._publish_now.wait(timeout=self._seconds_until_next_publish())
+
+    def _seconds_until_next_publish(self) -> float:
+        if self._last_publish is None:
+            return 60.0
+        next_due = self._last_publish + self.publish_interval
+        return max(30.0, (next_due - datetime.utcnow()).total_seconds())
 
 
 # ----------------------------------------------------------------------
 # Application helpers
 
 def init_casino(app) -> CasinoManager:
+    existing = getattr(app, "casino_manager", None)
+    if existing is not None:
+        return existing
     config_path = Path(app.root_path) / "config" / "casino.toml"
     manager = CasinoManager(app, config_path)
 
-    @app.before_request
-    def _ensure_casino_running() -> None:  # pragma: no cover - background thread
-        if not getattr(app, "_casino_thread_started", False):
-            manager.start()
-            setattr(app, "_casino_thread_started", True)
-
     import atexit
 
     atexit.register(manager.stop)
@@ -665,6 +832,10 @@ def init_casino(app) -> CasinoManager:
 
 def get_casino_manager() -> CasinoManager:
     if has_app_context():
-        return current_app.casino_manager
+        manager = getattr(current_app, "casino_manager", None)
+        if manager is None:
+            # Outside of a request (e.g. CLI or shell) the lazy boot hook has not run.
+            manager = init_casino(current_app._get_current_object())
+        return manager
     raise RuntimeError("No active Flask application context.")
 
@@ -1,19 +1,36 @@
 from __future__ import annotations
 
-import copy
+import json
 import math
+import time
 from contextvars import ContextVar
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
-from threading import Lock
-from typing import Dict, Iterable, Optional
+from threading import Event, Lock, Thread
+from types import MappingProxyType
+from typing import Dict, Iterable, Mapping, Optional
 
 import tomllib
 
 from . import db
 
 
+# Model classes, bound by _bind_models() once app.models can be imported without a cycle.
+_Product = None
+_PriceHistory = None
+_AppSetting = None
+
+
+def _bind_models() -> None:
+    global _Product, _PriceHistory, _AppSetting
+    if _AppSetting is not None:
+        return
+    from .models import AppSetting, PriceHistory, Product
+
+    _Product, _PriceHistory, _AppSetting = Product, PriceHistory, AppSetting
+
+
 _CURRENT_GAME_CONTEXT: ContextVar[Optional[str]] = ContextVar(
     "economy_game_context", default=None
 )
@@ -42,6 +59,50 @@ def _default_config() -> dict:
     }
 
 
+def _clone_config(config: dict) -> dict:
+    """Copy ``config`` section by section; the schema is fixed, so no deepcopy walk."""
+    pricing = config["pricing"]
+    payouts = config["payouts"]
+    return {
+        "pricing": {
+            **pricing,
+            "liquidity_overrides": dict(pricing.get("liquidity_overrides") or {}),
+        },
+        "payouts": {
+            **payouts,
+            "liquidity_overrides": dict(payouts.get("liquidity_overrides") or {}),
+            "tracked_games": list(payouts.get("tracked_games") or []),
+        },
+    }
+
+
+def _freeze_config(config: dict) -> Mapping[str, Mapping]:
+    """Return a read-only copy of ``config`` that can be shared between callers."""
+    pricing = config["pricing"]
+    payouts = config["payouts"]
+    return MappingProxyType(
+        {
+            "pricing": MappingProxyType(
+                {
+                    **pricing,
+                    "liquidity_overrides": MappingProxyType(
+                        dict(pricing.get("liquidity_overrides") or {})
+                    ),
+                }
+            ),
+            "payouts": MappingProxyType(
+                {
+                    **payouts,
+                    "liquidity_overrides": MappingProxyType(
+                        dict(payouts.get("liquidity_overrides") or {})
+                    ),
+                    "tracked_games": tuple(payouts.get("tracked_games") or ()),
+                }
+            ),
+        }
+    )
+
+
 def _ensure_directory(path: Path) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
 
@@ -49,37 +110,35 @@ def _ensure_directory(path: Path) -> None:
 def _render_config(config: dict) -> str:
     pricing = config.get("pricing", {})
     payouts = config.get("payouts", {})
-    lines: list[str] = []
-    lines.append("[pricing]")
-    lines.append(f"purchase_impact = {pricing.get('purchase_impact', 0.0)}")
-    lines.append(f"cross_cooling = {pricing.get('cross_cooling', 0.0)}")
-    lines.append(f"default_liquidity = {pricing.get('default_liquidity', 0.0)}")
-    lines.append(f"min_price = {pricing.get('min_price', 0.0)}")
-    lines.append(f"max_price = {pricing.get('max_price', 0.0)}")
+    lines = [
+        "[pricing]",
+        f"purchase_impact = {pricing.get('purchase_impact', 0.0)!r}",
+        f"cross_cooling = {pricing.get('cross_cooling', 0.0)!r}",
+        f"default_liquidity = {pricing.get('default_liquidity', 0.0)!r}",
+        f"min_price = {pricing.get('min_price', 0.0)!r}",
+        f"max_price = {pricing.get('max_price', 0.0)!r}",
+    ]
     liquidity_overrides = pricing.get("liquidity_overrides", {}) or {}
     if liquidity_overrides:
-        lines.append("")
-        lines.append("[pricing.liquidity_overrides]")
-        for key, value in liquidity_overrides.items():
-            lines.append(f"{key} = {float(value)}")
-
-    lines.append("")
-    lines.append("[payouts]")
-    lines.append(f"payout_impact = {payouts.get('payout_impact', 0.0)}")
-    lines.append(f"cross_recovery = {payouts.get('cross_recovery', 0.0)}")
-    lines.append(f"default_liquidity = {payouts.get('default_liquidity', 0.0)}")
-    lines.append(f"min_multiplier = {payouts.get('min_multiplier', 0.0)}")
-    lines.append(f"max_multiplier = {payouts.get('max_multiplier', 0.0)}")
-    lines.append(f"baseline_multiplier = {payouts.get('baseline_multiplier', 1.0)}")
-    tracked = payouts.get("tracked_games", []) or []
-    tracked_repr = ", ".join(f'"{game}"' for game in tracked)
-    lines.append(f"tracked_games = [{tracked_repr}]")
+        lines += ["", "[pricing.liquidity_overrides]"]
+        lines += [f"{key} = {float(value)!r}" for key, value in liquidity_overrides.items()]
+
+    lines += [
+        "",
+        "[payouts]",
+        f"payout_impact = {payouts.get('payout_impact', 0.0)!r}",
+        f"cross_recovery = {payouts.get('cross_recovery', 0.0)!r}",
+        f"default_liquidity = {payouts.get('default_liquidity', 0.0)!r}",
+        f"min_multiplier = {payouts.get('min_multiplier', 0.0)!r}",
+        f"max_multiplier = {payouts.get('max_multiplier', 0.0)!r}",
+        f"baseline_multiplier = {payouts.get('baseline_multiplier', 1.0)!r}",
+        # JSON string arrays are valid TOML and escape quotes in game keys.
+        f"tracked_games = {json.dumps([str(game) for game in payouts.get('tracked_games', []) or []])}",
+    ]
     payout_overrides = payouts.get("liquidity_overrides", {}) or {}
     if payout_overrides:
-        lines.append("")
-        lines.append("[payouts.liquidity_overrides]")
-        for key, value in payout_overrides.items():
-            lines.append(f"{key} = {float(value)}")
+        lines += ["", "[payouts.liquidity_overrides]"]
+        lines += [f"{key} = {float(value)!r}" for key, value in payout_overrides.items()]
     lines.append("")
     return "\n".join(lines).strip() + "\n"
 
@@ -107,14 +166,101 @@ class PurchaseQuoteContext:
     max_price: float
 
 
+@dataclass(frozen=True, slots=True)
+class _PricingParams:
+    purchase_impact: float
+    cross_cooling: float
+    default_liquidity: float
+    min_price: float
+    max_price: float
+
+    @classmethod
+    def from_config(cls, pricing: Mapping) -> _PricingParams:
+        return cls(
+            purchase_impact=float(pricing.get("purchase_impact", 0.0)),
+            cross_cooling=float(pricing.get("cross_cooling", 0.0)),
+            default_liquidity=float(pricing.get("default_liquidity", 1.0)),
+            min_price=float(pricing.get("min_price", 0.0)),
+            max_price=float(pricing.get("max_price", 0.0)),
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class _PayoutParams:
+    payout_impact: float
+    cross_recovery: float
+    default_liquidity: float
+    min_multiplier: float
+    max_multiplier: float
+    baseline_multiplier: float
+    tracked_games: tuple[str, ...]
+
+    @classmethod
+    def from_config(cls, payouts: Mapping) -> _PayoutParams:
+        return cls(
+            payout_impact=float(payouts.get("payout_impact", 0.0)),
+            cross_recovery=float(payouts.get("cross_recovery", 0.0)),
+            default_liquidity=float(payouts.get("default_liquidity", 1.0)),
+            min_multiplier=float(payouts.get("min_multiplier", 0.0)),
+            max_multiplier=float(payouts.get("max_multiplier", 10.0)),
+            baseline_multiplier=float(payouts.get("baseline_multiplier", 1.0)),
+            tracked_games=tuple(payouts.get("tracked_games") or ()),
+        )
+
+
 @dataclass
 class EconomyManager:
     config_path: Path
     _config: dict = field(default_factory=_default_config)
     _lock: Lock = field(default_factory=Lock)
     _config_mtime: Optional[float] = None
+    _config_snapshot: Optional[Mapping[str, Mapping]] = None
+    # Pricing liquidity overrides already coerced and floored, keyed as configured.
+    _pricing_liquidity_overrides: Dict[str, float] = field(default_factory=dict)
+    _pricing_params: Optional[_PricingParams] = None
+    _payout_params: Optional[_PayoutParams] = None
+    _payout_liquidity_overrides: Dict[str, float] = field(default_factory=dict)
+    # Membership view of ``payouts.tracked_games``; rebuilt with every config install.
+    _tracked_games_set: frozenset = frozenset()
+    # Seconds between checks of the config file's mtime once it has been loaded.
+    _stat_ttl: float = 1.0
+    _last_stat_check: float = 0.0
+    # Newly tracked games are written to disk by the flusher, not the request.
+    _flush_interval: float = 1.0
+    _pending_tracked: list[str] = field(default_factory=list)
+    _flush_thread: Optional[Thread] = None
+    _stop_flusher: Event = field(default_factory=Event)
+    # Raw stored multiplier per game key (None when unset); written through on change.
+    _multiplier_cache: Dict[str, Optional[str]] = field(default_factory=dict)
+    # Orders multiplier writes with their cache updates; separate from ``_lock`` so the
+    # database commit never stalls config reloads.
+    _multiplier_lock: Lock = field(default_factory=Lock)
+
+    def __post_init__(self) -> None:
+        _bind_models()
+        self._install_config_locked(self._config)
+
+    def _install_config_locked(self, config: dict) -> None:
+        """Make ``config`` current and rebuild everything derived from it."""
+        self._config = config
+        self._config_snapshot = _freeze_config(config)
+        self._pricing_params = _PricingParams.from_config(config["pricing"])
+        self._payout_params = _PayoutParams.from_config(config["payouts"])
+        overrides = config["pricing"].get("liquidity_overrides") or {}
+        self._pricing_liquidity_overrides = {
+            str(key): max(float(value), 1e-6) for key, value in overrides.items()
+        }
+        self._tracked_games_set = frozenset(self._payout_params.tracked_games)
+        payout_overrides = config["payouts"].get("liquidity_overrides") or {}
+        self._payout_liquidity_overrides = {
+            str(key): max(float(value), 1e-6) for key, value in payout_overrides.items()
+        }
 
     def _load_config_locked(self) -> None:
+        now = time.monotonic()
+        if self._config_mtime is not None and now - self._last_stat_check < self._stat_ttl:
+            return
+        self._last_stat_check = now
         try:
             stat = self.config_path.stat()
         except FileNotFoundError:
@@ -185,32 +331,78 @@ class EconomyManager:
         }
         tracked_games = raw_payouts.get("tracked_games", payouts.get("tracked_games", [])) or []
         payouts["tracked_games"] = [str(entry) for entry in tracked_games]
+        # Keep games tracked since the last flush even if the file changed underneath.
+        for key in self._pending_tracked:
+            if key not in payouts["tracked_games"]:
+                payouts["tracked_games"].append(key)
 
-        self._config = config
+        self._install_config_locked(config)
         self._config_mtime = stat.st_mtime
 
-    def _write_config_locked(self) -> None:
+    def _write_config_locked(self, config: Optional[dict] = None) -> None:
+        if config is None:
+            config = self._config
         _ensure_directory(self.config_path)
-        content = _render_config(self._config)
+        content = _render_config(config)
         self.config_path.write_text(content, encoding="utf-8")
+        # Swap the new config in only once it has been written successfully.
+        self._install_config_locked(config)
+        self._pending_tracked.clear()
         try:
             self._config_mtime = self.config_path.stat().st_mtime
         except FileNotFoundError:
             self._config_mtime = None
 
-    def get_config(self) -> dict:
+    def _current_config(self) -> dict:
+        """Return the live config, taking the lock only when it may need reloading."""
+        config = self._config
+        if self._config_mtime is not None:
+            now = time.monotonic()
+            if now - self._last_stat_check < self._stat_ttl:
+                return config
+            try:
+                mtime: Optional[float] = self.config_path.stat().st_mtime
+            except FileNotFoundError:
+                mtime = None
+            if mtime is not None and mtime == self._config_mtime:
+                self._last_stat_check = now
+                return config
+        with self._lock:
+            self._load_config_locked()
+            return self._config
+
+    def _current_pricing(self) -> _PricingParams:
+        self._current_config()
+        return self._pricing_params
+
+    def _current_payouts(self) -> _PayoutParams:
+        self._current_config()
+        return self._payout_params
+
+    def get_config(self) -> Mapping[str, Mapping]:
+        """Return the current config as a read-only snapshot shared between callers."""
+        self._current_config()
+        return self._config_snapshot
+
+    def force_reload(self) -> None:
+        """Re-read the config file now, ignoring the stat throttle and cached mtime."""
         with self._lock:
+            self._config_mtime = None
+            self._last_stat_check = 0.0
+            self._multiplier_cache.clear()
             self._load_config_locked()
-            return copy.deepcopy(self._config)
 
     def update_config(self, *, pricing: dict | None = None, payouts: dict | None = None) -> None:
         with self._lock:
+            # Always pick up external edits before applying admin changes on top.
+            self._last_stat_check = 0.0
             self._load_config_locked()
+            config = _clone_config(self._config)
             if pricing:
-                self._config["pricing"].update(pricing)
+                config["pricing"].update(pricing)
             if payouts:
-                self._config["payouts"].update(payouts)
-            self._write_config_locked()
+                config["payouts"].update(payouts)
+            self._write_config_locked(config)
 
     # Pricing adjustments -------------------------------------------------
     def apply_purchase(self, product, quantity: int) -> list[dict[str, float]]:
@@ -228,59 +420,77 @@ class EconomyManager:
         steps = abs(int(quantity))
         if steps <= 0:
             return []
-        from .models import Product
-
-        with self._lock:
-            self._load_config_locked()
-            pricing = self._config["pricing"]
+        pricing = self._current_pricing()
+        min_price = pricing.min_price
+        max_price = pricing.max_price
 
         liquidity = self._product_liquidity(product, pricing)
         base_price = max(product.price or 0.0, 0.0)
         ratio_inverse = _inverse_ratio(base_price or 1.0, liquidity)
-        increase = pricing["purchase_impact"] * ratio_inverse
+        increase = pricing.purchase_impact * ratio_inverse
         increase = min(increase, 5.0)
         step_factor = max(1e-6, 1.0 + increase)
         exponent = steps if direction > 0 else -steps
         factor = step_factor**exponent
-        new_price = _clamp(base_price * factor, pricing["min_price"], pricing["max_price"])
+        new_price = _clamp(base_price * factor, min_price, max_price)
         adjustments: dict[int, dict[str, float]] = {}
         if self._update_product_price(product, new_price):
-            product_id = int(getattr(product, "id", 0) or 0)
+            product_id = int(product.id or 0)
             adjustments[product_id] = {
                 "product_id": product_id,
                 "before": float(base_price),
                 "after": float(new_price),
             }
 
-        cross = pricing.get("cross_cooling", 0.0)
+        cross = pricing.cross_cooling
         if cross <= 0:
             return list(adjustments.values())
 
-        others: Iterable[Product] = (
-            Product.query.filter(Product.id != product.id, Product.enabled.is_(True)).all()
+        others = (
+            _Product.query.filter(_Product.id != product.id, _Product.enabled.is_(True)).all()
         )
-        for other in others:
-            other_liq = self._product_liquidity(other, pricing)
-            other_ratio_inverse = _inverse_ratio(other.price or 1.0, other_liq)
-            decrease = min(cross * steps * other_ratio_inverse, 0.95)
-            cross_factor = max(1e-6, 1.0 - decrease)
+        # Pull the inputs out of the ORM objects once, then run a single arithmetic
+        # pass with every per-request constant hoisted out of the loop.
+        prices = [float(other.price or 0.0) for other in others]
+        liquidities = [self._product_liquidity(other, pricing) for other in others]
+        cross_steps = cross * steps
+        now = datetime.utcnow()
+        changed: list = []
+        price_rows: list[dict] = []
+        for other, before_value, other_liq in zip(others, prices, liquidities):
+            # _inverse_ratio and _clamp, inlined to skip two calls per product.
+            other_ratio_inverse = (
+                other_liq / max(abs(before_value or 1.0), 1e-6) if other_liq > 0 else 0.0
+            )
+            cross_factor = max(1e-6, 1.0 - min(cross_steps * other_ratio_inverse, 0.95))
             if direction > 0:
-                new_value = (other.price or 0.0) * cross_factor
+                new_value = before_value * cross_factor
             else:
-                new_value = (other.price or 0.0) / cross_factor
-            new_value = _clamp(new_value, pricing["min_price"], pricing["max_price"])
-            before_value = float(other.price or 0.0)
-            if self._update_product_price(other, new_value):
-                key = int(getattr(other, "id", 0) or 0)
-                entry = adjustments.get(key)
-                if entry:
-                    entry["after"] = float(new_value)
-                else:
-                    adjustments[key] = {
-                        "product_id": key,
-                        "before": before_value,
-                        "after": float(new_value),
-                    }
+                new_value = before_value / cross_factor
+            if new_value < min_price:
+                new_value = min_price
+            elif new_value > max_price:
+                new_value = max_price
+            if not math.isfinite(new_value) or abs(before_value - new_value) < 1e-4:
+                continue
+            key = int(other.id)
+            changed.append(other)
+            price_rows.append({"id": key, "price": new_value, "updated_at": now})
+            adjustments[key] = {
+                "product_id": key,
+                "before": before_value,
+                "after": float(new_value),
+            }
+
+        if price_rows:
+            # One executemany each for the price updates and their history rows.
+            db.session.execute(db.update(_Product), price_rows)
+            db.session.execute(
+                db.insert(_PriceHistory),
+                [{"product_id": row["id"], "price": row["price"]} for row in price_rows],
+            )
+            for other in changed:
+                db.session.expire(other, ["price", "updated_at"])
 
         return list(adjustments.values())
 
@@ -294,41 +504,49 @@ class EconomyManager:
         first_price, step_factor, min_price, max_price = self._purchase_quote_parameters(product)
         current = first_price
         prices: list[float] = []
-        for _ in range(quantity):
-            prices.append(round(current, 4))
-            next_price = _clamp(current * step_factor, min_price, max_price)
+        for remaining in range(quantity, 0, -1):
+            rounded = round(current, 4)
+            prices.append(rounded)
+            # Inlined _clamp: this loop runs once per unit quoted.
+            next_price = current * step_factor
+            if next_price < min_price:
+                next_price = min_price
+            elif next_price > max_price:
+                next_price = max_price
             if not math.isfinite(next_price):
                 next_price = current
+            if next_price == current:
+                # A fixed point (price cap or a step factor of 1) repeats for the rest.
+                prices.extend([rounded] * (remaining - 1))
+                break
             current = next_price
         return prices
 
     def _purchase_quote_parameters(self, product) -> tuple[float, float, float, float]:
-        with self._lock:
-            self._load_config_locked()
-            pricing = self._config["pricing"]
+        pricing = self._current_pricing()
         liquidity = self._product_liquidity(product, pricing)
         base_price = max(product.price or 0.0, 0.0)
         ratio_inverse = _inverse_ratio(base_price or 1.0, liquidity)
-        increase = min(pricing["purchase_impact"] * ratio_inverse, 5.0)
+        increase = min(pricing.purchase_impact * ratio_inverse, 5.0)
         step_factor = max(0.0, 1.0 + increase)
-        min_price = pricing["min_price"]
-        max_price = pricing["max_price"]
+        min_price = pricing.min_price
+        max_price = pricing.max_price
         first_price = round(_clamp(base_price, min_price, max_price), 4)
         return first_price, step_factor, min_price, max_price
 
-    def _product_liquidity(self, product, pricing: dict) -> float:
-        overrides = pricing.get("liquidity_overrides", {}) or {}
-        key_id = str(getattr(product, "id", ""))
-        key_name = getattr(product, "name", "")
-        if key_id in overrides:
-            return max(float(overrides[key_id]), 1e-6)
-        lowered = key_name.lower() if isinstance(key_name, str) else ""
-        if lowered and lowered in overrides:
-            return max(float(overrides[lowered]), 1e-6)
-        base_stock = getattr(product, "base_stock", None)
+    def _product_liquidity(self, product, pricing: _PricingParams) -> float:
+        overrides = self._pricing_liquidity_overrides
+        if overrides:
+            key_id = str(product.id)
+            if key_id in overrides:
+                return overrides[key_id]
+            lowered = (product.name or "").lower()
+            if lowered and lowered in overrides:
+                return overrides[lowered]
+        base_stock = product.base_stock
         if base_stock is not None and base_stock > 0:
             return float(base_stock)
-        return float(pricing.get("default_liquidity", 1.0))
+        return pricing.default_liquidity
 
     def _update_product_price(self, product, new_price: float) -> bool:
         if not math.isfinite(new_price):
@@ -336,11 +554,9 @@ class EconomyManager:
         current = product.price or 0.0
         if abs(current - new_price) < 1e-4:
             return False
-        from .models import PriceHistory
-
         product.price = new_price
         product.updated_at = datetime.utcnow()
-        history = PriceHistory(product=product, price=new_price)
+        history = _PriceHistory(product=product, price=new_price)
         db.session.add(history)
         return True
 
@@ -348,107 +564,156 @@ class EconomyManager:
     def activate_game_context(self, key: str) -> float:
         key = str(key)
         _CURRENT_GAME_CONTEXT.set(key)
-        with self._lock:
-            self._load_config_locked()
-            self._ensure_tracked_game_locked(key)
-            payouts = self._config["payouts"]
-        return self.get_game_multiplier(key, payouts)
+        self._ensure_tracked_game(key)
+        return self.get_game_multiplier(key)
 
     def current_game_context(self) -> Optional[str]:
         return _CURRENT_GAME_CONTEXT.get()
 
-    def get_game_multiplier(self, key: str, payouts_cfg: Optional[dict] = None) -> float:
-        from .models import AppSetting
-
-        if payouts_cfg is None:
-            with self._lock:
-                self._load_config_locked()
-                payouts_cfg = self._config["payouts"]
-        stored = AppSetting.get(f"economy:game:{key}:multiplier", None)
-        if stored is None:
-            return float(payouts_cfg.get("baseline_multiplier", 1.0))
-        try:
-            value = float(stored)
-        except (TypeError, ValueError):
-            return float(payouts_cfg.get("baseline_multiplier", 1.0))
-        return _clamp(
-            value,
-            float(payouts_cfg.get("min_multiplier", 0.0)),
-            float(payouts_cfg.get("max_multiplier", 10.0)),
-        )
-
-    def _set_game_multiplier(self, key: str, value: float, payouts_cfg: dict) -> None:
-        from .models import AppSetting
-
-        value = _clamp(
-            float(value),
-            float(payouts_cfg.get("min_multiplier", 0.0)),
-            float(payouts_cfg.get("max_multiplier", 10.0)),
-        )
-        current = self.get_game_multiplier(key, payouts_cfg)
+    def get_game_multiplier(self, key: str, payouts: Optional[_PayoutParams] = None) -> float:
+        if payouts is None:
+            payouts = self._current_payouts()
+        return self._resolve_multipliers((key,), payouts)[key]
+
+    def _resolve_multipliers(
+        self, keys: Iterable[str], payouts: _PayoutParams
+    ) -> Dict[str, float]:
+        """Look up the multipliers for ``keys``, querying only uncached ones in one batch."""
+        cache = self._multiplier_cache
+        keys = list(keys)
+        missing = {key: _multiplier_setting_key(key) for key in keys if key not in cache}
+        if missing:
+            try:
+                stored = _AppSetting.get_many(list(missing.values()), strict=True)
+            except Exception:
+                # Settings unreadable (e.g. table not created yet): serve the baseline
+                # now and leave the keys uncached so the next call asks again.
+                stored = None
+            if stored is not None:
+                for key, setting_key in missing.items():
+                    # A write-through that landed after our read is newer; keep it.
+                    cache.setdefault(key, stored.get(setting_key))
+        return {key: _parse_multiplier(cache.get(key), payouts) for key in keys}
+
+    def _set_game_multiplier(
+        self, key: str, value: float, payouts: _PayoutParams, current: Optional[float] = None
+    ) -> None:
+        value = _clamp(float(value), payouts.min_multiplier, payouts.max_multiplier)
+        if current is None:
+            current = self.get_game_multiplier(key, payouts)
         if abs(current - value) < 1e-4:
             return
-        AppSetting.set(f"economy:game:{key}:multiplier", f"{value:.6f}")
+        stored = f"{value:.6f}"
+        with self._multiplier_lock:
+            _AppSetting.set(_multiplier_setting_key(key), stored)
+            self._multiplier_cache[key] = stored
 
     def record_game_payout(self, amount: float, game_key: Optional[str] = None) -> None:
         if amount <= 0:
             return
-        with self._lock:
-            self._load_config_locked()
-            payouts = self._config["payouts"]
+        payouts = self._current_payouts()
         key = str(game_key or self.current_game_context() or "")
         if not key:
             return
-        self._ensure_tracked_game(key, payouts)
+        self._ensure_tracked_game(key)
         liquidity = self._game_liquidity(key, payouts)
         inverse = _inverse_ratio(amount, liquidity)
-        primary_decrease = min(payouts["payout_impact"] * inverse, 0.95)
+        primary_decrease = min(payouts.payout_impact * inverse, 0.95)
         current = self.get_game_multiplier(key, payouts)
         primary_multiplier = current * max(0.0, 1.0 - primary_decrease)
-        self._set_game_multiplier(key, primary_multiplier, payouts)
+        self._set_game_multiplier(key, primary_multiplier, payouts, current=current)
 
-        cross = payouts.get("cross_recovery", 0.0)
+        cross = payouts.cross_recovery
         if cross <= 0:
             return
 
-        for other_key in self._tracked_games(payouts):
-            if other_key == key:
-                continue
-            other_multiplier = self.get_game_multiplier(other_key, payouts)
+        others = self._resolve_multipliers(
+            (other_key for other_key in payouts.tracked_games if other_key != key),
+            payouts,
+        )
+        min_multiplier = payouts.min_multiplier
+        max_multiplier = payouts.max_multiplier
+        updates: Dict[str, str] = {}
+        for other_key, other_multiplier in others.items():
             other_liq = self._game_liquidity(other_key, payouts)
             other_inverse = _inverse_ratio(other_multiplier or 1.0, other_liq)
             increase = min(cross * other_inverse, 0.5)
-            adjusted = other_multiplier * (1.0 + increase)
-            self._set_game_multiplier(other_key, adjusted, payouts)
+            adjusted = _clamp(other_multiplier * (1.0 + increase), min_multiplier, max_multiplier)
+            if abs(other_multiplier - adjusted) >= 1e-4:
+                updates[other_key] = f"{adjusted:.6f}"
+        if updates:
+            # Every recovered multiplier lands in one settings write and commit.
+            with self._multiplier_lock:
+                _AppSetting.set_many(
+                    {_multiplier_setting_key(other_key): text for other_key, text in updates.items()}
+                )
+                self._multiplier_cache.update(updates)
 
     def get_game_multipliers(self) -> Dict[str, float]:
-        with self._lock:
-            self._load_config_locked()
-            payouts = self._config["payouts"]
-            keys = list(self._tracked_games(payouts))
-        return {key: self.get_game_multiplier(key, payouts) for key in keys}
+        payouts = self._current_payouts()
+        return self._resolve_multipliers(payouts.tracked_games, payouts)
 
     def _ensure_tracked_game_locked(self, key: str) -> None:
-        payouts = self._config["payouts"]
-        if key not in payouts.get("tracked_games", []):
+        if key not in self._tracked_games_set:
+            payouts = self._config["payouts"]
             payouts.setdefault("tracked_games", []).append(key)
-            self._write_config_locked()
+            self._pending_tracked.append(key)
+            self._install_config_locked(self._config)
 
-    def _ensure_tracked_game(self, key: str, payouts: dict) -> None:
+    def _ensure_tracked_game(self, key: str) -> None:
+        if key in self._tracked_games_set:
+            return
         with self._lock:
             self._load_config_locked()
-            if key not in self._config["payouts"].get("tracked_games", []):
-                self._config["payouts"].setdefault("tracked_games", []).append(key)
+            self._ensure_tracked_game_locked(key)
+
+    # Deferred config writes ----------------------------------------------
+    def flush_config(self) -> None:
+        """Write newly tracked games to the config file if any are pending."""
+        with self._lock:
+            if self._pending_tracked:
                 self._write_config_locked()
 
-    def _tracked_games(self, payouts: dict) -> Iterable[str]:
-        return payouts.get("tracked_games", []) or []
+    def start(self) -> None:
+        if self._flush_thread and self._flush_thread.is_alive():
+            return
+        self._stop_flusher.clear()
+        self._flush_thread = Thread(target=self._run, name="economy-config-flusher", daemon=True)
+        self._flush_thread.start()
+
+    def stop(self) -> None:
+        self._stop_flusher.set()
+        if self._flush_thread and self._flush_thread.is_alive():
+            self._flush_thread.join(timeout=1)
+        self.flush_config()
+
+    def _run(self) -> None:  # pragma: no cover - background thread
+        while not self._stop_flusher.wait(self._flush_interval):
+            try:
+                self.flush_config()
+            except OSError:
+                # Leave the games pending and retry on the next tick.
+                continue
+
+    def _game_liquidity(self, key: str, payouts: _PayoutParams) -> float:
+        liquidity = self._payout_liquidity_overrides.get(key)
+        if liquidity is not None:
+            return liquidity
+        return payouts.default_liquidity
+
+
+def _multiplier_setting_key(game_key: str) -> str:
+    return f"economy:game:{game_key}:multiplier"
 
-    def _game_liquidity(self, key: str, payouts: dict) -> float:
-        overrides = payouts.get("liquidity_overrides", {}) or {}
-        if key in overrides:
-            return max(float(overrides[key]), 1e-6)
-        return float(payouts.get("default_liquidity", 1.0))
+
+def _parse_multiplier(stored: Optional[str], payouts: _PayoutParams) -> float:
+    if stored is None:
+        return payouts.baseline_multiplier
+    try:
+        value = float(stored)
+    except (TypeError, ValueError):
+        return payouts.baseline_multiplier
+    return _clamp(value, payouts.min_multiplier, payouts.max_multiplier)
 
 
 def _is_number(value) -> bool:
@@ -475,6 +740,10 @@ def init_economy(app) -> None:
     # Ensure initial config exists
     _economy_manager.get_config()
 
+    import atexit
+
+    atexit.register(_economy_manager.stop)
+
 
 def get_economy_manager() -> Optional[EconomyManager]:
     return _economy_manager
@@ -3,11 +3,15 @@ from __future__ import annotations
 
 import hashlib
 import json
+import os
 import random
+import sys
+import threading
 import time
 from dataclasses import dataclass, field
+from operator import attrgetter, itemgetter
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Optional
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 from flask import current_app, has_app_context
 
@@ -28,6 +32,21 @@ def _as_float(value: Any, default: float = 0.0) -> float:
         return default
 
 
+def _optional_text(value: Any) -> Optional[str]:
+    """Return ``value`` stripped when it is a non-blank string, otherwise ``None``."""
+    if isinstance(value, str):
+        value = value.strip()
+        if value:
+            return value
+    return None
+
+
+# Columns of a [[games]] entry that are not passed through as params.
+_GAME_RESERVED_KEYS = frozenset({"key", "name", "type", "description", "enabled"})
+# Choice values accepted from TOML; anything else (tables, arrays) is dropped.
+_CHOICE_TYPES = (str, int, float)
+
+
 def _load_toml(path: Path) -> dict:
     if not path.exists():
         return {}
@@ -35,7 +54,7 @@ def _load_toml(path: Path) -> dict:
         return tomllib.load(handle)
 
 
-@dataclass
+@dataclass(slots=True)
 class GameDefinition:
     key: str
     name: str
@@ -43,38 +62,46 @@ class GameDefinition:
     description: str
     enabled: bool = True
     params: Dict[str, Any] = field(default_factory=dict)
+    # Sort key for the lobby listing.
+    name_lower: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self.name_lower = self.name.lower()
 
 
-@dataclass
+@dataclass(slots=True)
 class TriviaQuestion:
     id: str
     prompt: str
-    choices: List[str]
+    choices: Tuple[str, ...]
     answer: int
     hash_value: str
     image: Optional[str] = None
     explanation: Optional[str] = None
     submitted_by: Optional[str] = None
     source: str = "primary"
+    # ``hash_value`` as an integer, parsed once for the per-user ordering.
+    hash_int: int = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self.hash_int = int(self.hash_value, 16)
 
 
-@dataclass
+@dataclass(slots=True)
 class TriviaSet:
     key: str
     title: str
     description: Optional[str]
     reward: float
-    questions: List[TriviaQuestion] = field(default_factory=list)
+    questions: Tuple[TriviaQuestion, ...] = ()
 
     def ordered_pairs_for_user(self, user_hash: int) -> List[tuple[int, TriviaQuestion]]:
         """Return sorted (order value, question) pairs for the given user hash."""
 
-        pairs: List[tuple[int, TriviaQuestion]] = []
-        for question in self.questions:
-            question_hash = int(question.hash_value, 16)
-            order_value = question_hash ^ user_hash
-            pairs.append((order_value, question))
-        return sorted(pairs, key=lambda item: item[0])
+        return sorted(
+            ((question.hash_int ^ user_hash, question) for question in self.questions),
+            key=itemgetter(0),
+        )
 
 
 class GamesManager:
@@ -85,47 +112,99 @@ class GamesManager:
         self.games_path = games_path
         self.trivia_path = trivia_path
         self.submitted_trivia_path = submitted_trivia_path
+        # String forms for the per-check stat calls, resolved once.
+        self._games_fspath = os.fspath(games_path)
+        self._trivia_fspath = os.fspath(trivia_path)
+        self._submitted_trivia_fspath = os.fspath(submitted_trivia_path)
         self._games: Dict[str, GameDefinition] = {}
+        # Enabled games ordered for the lobby; rebuilt whenever ``_games`` is replaced.
+        self._enabled_sorted_games: List[GameDefinition] = []
         self._trivia_sets: Dict[str, TriviaSet] = {}
         self._base_trivia_sets: Dict[str, TriviaSet] = {}
         self._submitted_trivia_sets: Dict[str, TriviaSet] = {}
         self._serializer = URLSafeSerializer(app.config.get("SECRET_KEY", "dev"), salt="games")
+        self._dumps = self._serializer.dumps
+        self._loads = self._serializer.loads
         self._games_mtime: Optional[float] = None
         self._trivia_mtime: Optional[float] = None
         self._submitted_trivia_mtime: Optional[float] = None
         self._failed_games_mtime: Optional[float] = None
         self._failed_trivia_mtime: Optional[float] = None
         self._failed_submitted_trivia_mtime: Optional[float] = None
-        self.reload(force=True)
+        # Seconds between mtime checks of the config files; 0 checks on every access.
+        self._recheck_interval = float(app.config.get("GAMES_RECHECK_INTERVAL", 0.5))
+        self._last_check_monotonic = float("-inf")
+        # Watch games.toml and trivia.toml for edits; off outside debug unless configured.
+        # reload(force=True) still picks up edits when this is disabled.
+        self._hot_reload = bool(app.config.get("GAMES_HOT_RELOAD", getattr(app, "debug", False)))
+        # Serialises reloads and submission writes. Re-entrant because submissions
+        # reload the submitted file while holding it.
+        self._reload_lock = threading.RLock()
+        # Parsed TOML per path, keyed by the (st_mtime_ns, st_size) it was read at.
+        self._toml_cache: Dict[Path, tuple[int, int, dict]] = {}
+        # Raw question count per set in the submitted file, and the key of its last set.
+        self._submitted_question_counts: Dict[str, int] = {}
+        self._submitted_last_key: Optional[str] = None
+        # Last parse per trivia source as (parsed TOML, sets). The TOML cache hands back
+        # the same mapping while a file is unchanged, so identity means nothing to redo.
+        self._parsed_trivia: Dict[str, tuple[dict, Dict[str, TriviaSet]]] = {}
+        self._submitted_dir_ready = False
+        # Config files are first read by whichever lookup or submission needs them.
+        self._loaded = False
 
     # ------------------------------------------------------------------
     # Configuration loading
     def reload(self, *, force: bool = False) -> None:
-        if force:
-            self._games_mtime = None
-            self._trivia_mtime = None
-            self._submitted_trivia_mtime = None
-            self._failed_games_mtime = None
-            self._failed_trivia_mtime = None
-            self._failed_submitted_trivia_mtime = None
-            self._base_trivia_sets = {}
-            self._submitted_trivia_sets = {}
-        self._ensure_current(force=force)
+        with self._reload_lock:
+            if force:
+                self._games_mtime = None
+                self._trivia_mtime = None
+                self._submitted_trivia_mtime = None
+                self._failed_games_mtime = None
+                self._failed_trivia_mtime = None
+                self._failed_submitted_trivia_mtime = None
+                self._base_trivia_sets = {}
+                self._submitted_trivia_sets = {}
+            self._ensure_current(force=force)
+            if force:
+                self._loaded = True
+
+    def _load_initial(self) -> None:
+        with self._reload_lock:
+            if not self._loaded:
+                self.reload(force=True)
 
     def _ensure_current(self, *, force: bool = False) -> None:
-        self._maybe_reload_games(force=force)
-        self._maybe_reload_trivia(force=force)
-        self._maybe_reload_submitted_trivia(force=force)
+        if not self._loaded and not force:
+            self._load_initial()
+            return
+        now = time.monotonic()
+        if not force and now - self._last_check_monotonic < self._recheck_interval:
+            return
+        # While another thread reloads, readers keep serving the loaded config;
+        # briefly stale config is preferable to parsing the same files in parallel.
+        if not self._reload_lock.acquire(blocking=force):
+            return
+        try:
+            if force or self._hot_reload:
+                self._maybe_reload_games(force=force)
+                self._maybe_reload_trivia(force=force)
+            # Submissions are appended at runtime, possibly by another worker process.
+            self._maybe_reload_submitted_trivia(force=force)
+            # Stamped only once the files are loaded so lookups never skip an unfinished load.
+            self._last_check_monotonic = now
+        finally:
+            self._reload_lock.release()
 
     def _maybe_reload_games(self, *, force: bool = False) -> None:
-        current_mtime = self._get_mtime(self.games_path)
+        current_mtime = self._get_mtime(self._games_fspath)
         if not force:
             if current_mtime == self._games_mtime:
                 return
             if current_mtime is not None and current_mtime == self._failed_games_mtime:
                 return
         try:
-            data = _load_toml(self.games_path)
+            data = self._load_toml_cached(self.games_path)
         except TOMLDecodeError as error:  # pragma: no cover - depends on toml parser
             self._failed_games_mtime = current_mtime
             self._log_warning("Failed to parse games configuration; keeping previous games.", error)
@@ -136,18 +215,22 @@ class GamesManager:
             return
 
         self._games = self._parse_games(data)
+        self._enabled_sorted_games = sorted(
+            (game for game in self._games.values() if game.enabled),
+            key=attrgetter("name_lower"),
+        )
         self._games_mtime = current_mtime
         self._failed_games_mtime = None
 
     def _maybe_reload_trivia(self, *, force: bool = False) -> None:
-        current_mtime = self._get_mtime(self.trivia_path)
+        current_mtime = self._get_mtime(self._trivia_fspath)
         if not force:
             if current_mtime == self._trivia_mtime:
                 return
             if current_mtime is not None and current_mtime == self._failed_trivia_mtime:
                 return
         try:
-            data = _load_toml(self.trivia_path)
+            data = self._load_toml_cached(self.trivia_path)
         except TOMLDecodeError as error:  # pragma: no cover - depends on toml parser
             self._failed_trivia_mtime = current_mtime
             self._log_warning("Failed to parse trivia configuration; keeping previous sets.", error)
@@ -164,14 +247,14 @@ class GamesManager:
         self._failed_trivia_mtime = None
 
     def _maybe_reload_submitted_trivia(self, *, force: bool = False) -> None:
-        current_mtime = self._get_mtime(self.submitted_trivia_path)
+        current_mtime = self._get_mtime(self._submitted_trivia_fspath)
         if not force:
             if current_mtime == self._submitted_trivia_mtime:
                 return
             if current_mtime is not None and current_mtime == self._failed_submitted_trivia_mtime:
                 return
         try:
-            data = _load_toml(self.submitted_trivia_path)
+            data = self._load_toml_cached(self.submitted_trivia_path)
         except TOMLDecodeError as error:  # pragma: no cover - depends on toml parser
             self._failed_submitted_trivia_mtime = current_mtime
             self._log_warning(
@@ -189,10 +272,28 @@ class GamesManager:
 
         submitted_sets = self._parse_trivia_sets(data, source="submitted")
         self._submitted_trivia_sets = submitted_sets
+        self._index_submitted_file(data)
         self._rebuild_trivia_sets()
         self._submitted_trivia_mtime = current_mtime
         self._failed_submitted_trivia_mtime = None
 
+    def _load_toml_cached(self, path: Path) -> dict:
+        """Parse ``path``, reusing the previous result while the file is unchanged.
+
+        Callers must treat the returned mapping as read-only since it is shared.
+        """
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            self._toml_cache.pop(path, None)
+            return {}
+        cached = self._toml_cache.get(path)
+        if cached is not None and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+            return cached[2]
+        data = _load_toml(path)
+        self._toml_cache[path] = (stat.st_mtime_ns, stat.st_size, data)
+        return data
+
     def _parse_games(self, data: Dict[str, Any]) -> Dict[str, GameDefinition]:
         if not isinstance(data, dict):
             return {}
@@ -200,23 +301,13 @@ class GamesManager:
         for entry in data.get("games", []):
             if not isinstance(entry, dict):
                 continue
-            key = str(entry.get("key", "")).strip()
+            key = sys.intern(str(entry.get("key", "")).strip())
             name = str(entry.get("name", key or "Game")).strip() or "Game"
-            type_ = str(entry.get("type", "")).strip()
+            # Game types are a small closed set shared by many entries.
+            type_ = sys.intern(str(entry.get("type", "")).strip())
             description = str(entry.get("description", "")).strip()
             enabled = self._coerce_enabled(entry.get("enabled", True))
-            params = {
-                k: v
-                for k, v in entry.items()
-                if k
-                not in {
-                    "key",
-                    "name",
-                    "type",
-                    "description",
-                    "enabled",
-                }
-            }
+            params = {k: v for k, v in entry.items() if k not in _GAME_RESERVED_KEYS}
             if key and type_:
                 games[key] = GameDefinition(
                     key=key,
@@ -231,11 +322,15 @@ class GamesManager:
     def _parse_trivia_sets(self, data: Dict[str, Any], *, source: str) -> Dict[str, TriviaSet]:
         if not isinstance(data, dict):
             return {}
+        cached = self._parsed_trivia.get(source)
+        if cached is not None and cached[0] is data:
+            return cached[1]
+        source = sys.intern(source)
         sets: Dict[str, TriviaSet] = {}
         for entry in data.get("sets", []):
             if not isinstance(entry, dict):
                 continue
-            key = str(entry.get("key", "")).strip()
+            key = sys.intern(str(entry.get("key", "")).strip())
             if not key:
                 continue
             title = str(entry.get("title", key)).strip() or key
@@ -246,6 +341,7 @@ class GamesManager:
                 description_value = None
             reward = _as_float(entry.get("reward", 5.0), 5.0)
             questions: List[TriviaQuestion] = []
+            set_hasher = hashlib.sha256(f"{key}::".encode("utf-8"))
             for question_data in entry.get("questions", []):
                 if not isinstance(question_data, dict):
                     continue
@@ -254,31 +350,38 @@ class GamesManager:
                 choices = question_data.get("choices") or []
                 if not isinstance(choices, list):
                     choices = []
-                clean_choices = [str(choice) for choice in choices if isinstance(choice, (str, int, float))]
+                # Choices such as "True"/"False" repeat across questions; share one copy.
+                if all(type(choice) is str for choice in choices):
+                    clean_choices = tuple(sys.intern(choice) for choice in choices)
+                else:
+                    clean_choices = tuple(
+                        sys.intern(str(choice))
+                        for choice in choices
+                        if isinstance(choice, _CHOICE_TYPES)
+                    )
                 answer = int(question_data.get("answer", 0))
-                image = question_data.get("image")
-                image_value = str(image).strip() if isinstance(image, str) and image.strip() else None
-                explanation = question_data.get("explanation")
-                explanation_value = (
-                    str(explanation).strip() if isinstance(explanation, str) and explanation.strip() else None
-                )
-                submitted_by = question_data.get("submitted_by")
-                submitted_by_value = (
-                    str(submitted_by).strip() if isinstance(submitted_by, str) and submitted_by.strip() else None
-                )
+                image_value = _optional_text(question_data.get("image"))
+                explanation_value = _optional_text(question_data.get("explanation"))
+                submitted_by_value = _optional_text(question_data.get("submitted_by"))
+                if submitted_by_value is not None:
+                    submitted_by_value = sys.intern(submitted_by_value)
                 if prompt and clean_choices:
-                    hash_seed_parts = [
-                        key,
-                        qid,
-                        prompt,
-                        "|".join(clean_choices),
-                        str(answer),
-                        image_value or "",
-                        explanation_value or "",
-                        submitted_by_value or "",
-                    ]
-                    hash_seed = "::".join(hash_seed_parts).encode("utf-8")
-                    question_hash = hashlib.sha256(hash_seed).hexdigest()
+                    # Same digest as hashing "::".join(key, qid, prompt, ...) in one go.
+                    hasher = set_hasher.copy()
+                    hasher.update(
+                        "::".join(
+                            (
+                                qid,
+                                prompt,
+                                "|".join(clean_choices),
+                                str(answer),
+                                image_value or "",
+                                explanation_value or "",
+                                submitted_by_value or "",
+                            )
+                        ).encode("utf-8")
+                    )
+                    question_hash = hasher.hexdigest()
                     questions.append(
                         TriviaQuestion(
                             id=qid,
@@ -292,39 +395,41 @@ class GamesManager:
                             source=source,
                         )
                     )
-            if questions:
+            existing = sets.get(key)
+            if existing is not None:
+                # Appended submissions repeat a set's [[sets]] table; the first one wins.
+                existing.questions += tuple(questions)
+            elif questions:
                 sets[key] = TriviaSet(
                     key=key,
                     title=title,
                     description=description_value,
                     reward=max(0.0, reward),
-                    questions=questions,
+                    questions=tuple(questions),
                 )
+        self._parsed_trivia[source] = (data, sets)
         return sets
 
     def _rebuild_trivia_sets(self) -> None:
-        merged: Dict[str, TriviaSet] = {}
-        for key, base_set in self._base_trivia_sets.items():
-            merged[key] = TriviaSet(
-                key=base_set.key,
-                title=base_set.title,
-                description=base_set.description,
-                reward=base_set.reward,
-                questions=list(base_set.questions),
-            )
-        for key, submitted_set in self._submitted_trivia_sets.items():
-            existing = merged.get(key)
-            if existing is None:
-                merged[key] = TriviaSet(
-                    key=submitted_set.key,
-                    title=submitted_set.title,
-                    description=submitted_set.description,
-                    reward=submitted_set.reward,
-                    questions=list(submitted_set.questions),
-                )
-            else:
-                existing.questions.extend(submitted_set.questions)
-        self._trivia_sets = merged
+        keys = dict.fromkeys([*self._base_trivia_sets, *self._submitted_trivia_sets])
+        self._trivia_sets = {key: self._merge_trivia_set(key) for key in keys}
+
+    def _merge_trivia_set(self, key: str) -> TriviaSet:
+        """Combine base and submitted questions for ``key``, sharing a side when it is alone."""
+
+        base_set = self._base_trivia_sets.get(key)
+        submitted_set = self._submitted_trivia_sets.get(key)
+        if submitted_set is None:
+            return base_set
+        if base_set is None:
+            return submitted_set
+        return TriviaSet(
+            key=base_set.key,
+            title=base_set.title,
+            description=base_set.description,
+            reward=base_set.reward,
+            questions=base_set.questions + submitted_set.questions,
+        )
 
     # ------------------------------------------------------------------
     # Submission helpers
@@ -335,41 +440,6 @@ class GamesManager:
         if not clean_key:
             raise ValueError("set_key is required")
 
-        path = self.submitted_trivia_path
-        path.parent.mkdir(parents=True, exist_ok=True)
-
-        try:
-            data = _load_toml(path)
-        except Exception:
-            data = {}
-
-        sets_list: List[Dict[str, Any]]
-        sets = data.get("sets")
-        if isinstance(sets, list):
-            sets_list = [entry for entry in sets if isinstance(entry, dict)]
-        else:
-            sets_list = []
-
-        base_set = self._base_trivia_sets.get(clean_key) or self._submitted_trivia_sets.get(clean_key)
-        set_entry: Optional[Dict[str, Any]] = None
-        for entry in sets_list:
-            if str(entry.get("key", "")).strip() == clean_key:
-                set_entry = entry
-                break
-        if set_entry is None:
-            set_entry = {"key": clean_key}
-            if base_set is not None:
-                set_entry.setdefault("title", base_set.title)
-                if base_set.description:
-                    set_entry.setdefault("description", base_set.description)
-                set_entry.setdefault("reward", base_set.reward)
-            sets_list.append(set_entry)
-
-        questions = set_entry.setdefault("questions", [])
-        if not isinstance(questions, list):
-            questions = []
-            set_entry["questions"] = questions
-
         prompt_text = str(question_data.get("prompt", "")).strip()
         raw_choices = question_data.get("choices", [])
         if not isinstance(raw_choices, Iterable):
@@ -391,7 +461,7 @@ class GamesManager:
             submitted_by_value = None
 
         new_question = {
-            "id": str(question_data.get("id", "")).strip() or f"{clean_key}-submitted-{len(questions)}",
+            "id": str(question_data.get("id", "")).strip(),
             "prompt": prompt_text,
             "choices": clean_choices,
             "answer": answer_index,
@@ -402,62 +472,197 @@ class GamesManager:
         if question_data.get("explanation"):
             new_question["explanation"] = str(question_data["explanation"])
 
+        with self._reload_lock:
+            if not self._loaded:
+                self.reload(force=True)
+            path = self.submitted_trivia_path
+            if not self._submitted_dir_ready:
+                path.parent.mkdir(parents=True, exist_ok=True)
+                self._submitted_dir_ready = True
+
+            base_set = self._base_trivia_sets.get(clean_key) or self._submitted_trivia_sets.get(
+                clean_key
+            )
+            if self._get_mtime(self._submitted_trivia_fspath) == self._submitted_trivia_mtime:
+                # The in-memory index matches the file, so only the new question is written.
+                existing_count = self._submitted_question_counts.get(clean_key)
+                if not new_question["id"]:
+                    new_question["id"] = f"{clean_key}-submitted-{existing_count or 0}"
+                set_entry: Dict[str, Any] = {"key": clean_key}
+                if existing_count is None and base_set is not None:
+                    self._describe_new_set(set_entry, base_set)
+                lines: List[str] = []
+                if self._submitted_last_key != clean_key:
+                    # [[sets.questions]] attaches to the last [[sets]] table in the file.
+                    lines += self._format_set_lines(set_entry)
+                lines += self._format_question_lines(new_question)
+                with path.open("a", encoding="utf-8") as handle:
+                    handle.write("\n" + "\n".join(lines) + "\n")
+                self._toml_cache.pop(path, None)
+                # The splice below extends the cached sets, so they no longer match any file.
+                self._parsed_trivia.pop("submitted", None)
+                if existing_count is None or clean_key in self._submitted_trivia_sets:
+                    return self._splice_submitted_question(path, set_entry, new_question)
+            else:
+                self._rewrite_submitted_trivia(path, clean_key, new_question, base_set)
+
+            # Only the submitted file changed; the games and base trivia stay as loaded.
+            self._toml_cache.pop(path, None)
+            self._maybe_reload_submitted_trivia(force=True)
+            trivia_set = self.get_trivia_set(clean_key)
+            if trivia_set is None:
+                raise RuntimeError("Failed to reload trivia set after submission")
+            for question in trivia_set.questions:
+                if question.id == new_question["id"]:
+                    return question
+            raise RuntimeError("Submitted question not found after reload")
+
+    def _splice_submitted_question(
+        self, path: Path, set_entry: Dict[str, Any], new_question: Dict[str, Any]
+    ) -> TriviaQuestion:
+        """Add a just-appended question to the loaded sets without reparsing the file."""
+
+        key = set_entry["key"]
+        parsed = self._parse_trivia_sets(
+            {"sets": [{**set_entry, "questions": [new_question]}]}, source="submitted"
+        )
+        new_set = parsed[key]
+        question = new_set.questions[0]
+        existing = self._submitted_trivia_sets.get(key)
+        if existing is None:
+            self._submitted_trivia_sets[key] = new_set
+        else:
+            existing.questions += (question,)
+        self._submitted_question_counts[key] = self._submitted_question_counts.get(key, 0) + 1
+        self._submitted_last_key = key
+        self._submitted_trivia_mtime = self._get_mtime(self._submitted_trivia_fspath)
+        # Only this set changed, so the other merged sets are reused as they are.
+        trivia_sets = dict(self._trivia_sets)
+        trivia_sets[key] = self._merge_trivia_set(key)
+        self._trivia_sets = trivia_sets
+        return question
+
+    def _rewrite_submitted_trivia(
+        self,
+        path: Path,
+        clean_key: str,
+        new_question: Dict[str, Any],
+        base_set: Optional[TriviaSet],
+    ) -> None:
+        """Rewrite the whole submitted file when it changed since it was last loaded."""
+
+        try:
+            data = _load_toml(path)
+        except Exception:
+            data = {}
+
+        sets_list: List[Dict[str, Any]]
+        sets = data.get("sets")
+        if isinstance(sets, list):
+            sets_list = [entry for entry in sets if isinstance(entry, dict)]
+        else:
+            sets_list = []
+
+        # Appends leave repeated [[sets]] tables per key; fold each key's tables into its
+        # first one (as the parser does) so new ids count every question in the set.
+        merged_sets: Dict[str, Dict[str, Any]] = {}
+        for entry in sets_list:
+            entry_key = str(entry.get("key", "")).strip()
+            questions = entry.get("questions")
+            if not isinstance(questions, list):
+                questions = []
+            first = merged_sets.get(entry_key)
+            if first is None:
+                merged_sets[entry_key] = entry
+                entry["questions"] = list(questions)
+            else:
+                first["questions"].extend(questions)
+        sets_list = list(merged_sets.values())
+
+        set_entry = merged_sets.get(clean_key)
+        if set_entry is None:
+            set_entry = {"key": clean_key}
+            if base_set is not None:
+                self._describe_new_set(set_entry, base_set)
+            sets_list.append(set_entry)
+
+        questions = set_entry.setdefault("questions", [])
+        if not new_question["id"]:
+            new_question["id"] = f"{clean_key}-submitted-{len(questions)}"
         questions.append(new_question)
 
         # Write TOML content back to disk
         lines: List[str] = []
         for entry in sets_list:
-            lines.append("[[sets]]")
-            for field_name in ("key", "title", "description", "reward"):
-                value = entry.get(field_name)
-                if value is None:
-                    continue
-                lines.append(f"{field_name} = {self._format_toml_value(value)}")
+            lines += self._format_set_lines(entry)
             for question in entry.get("questions", []) or []:
                 if not isinstance(question, dict):
                     continue
-                lines.append("")
-                lines.append("  [[sets.questions]]")
-                for field_name in (
-                    "id",
-                    "prompt",
-                    "choices",
-                    "answer",
-                    "image",
-                    "explanation",
-                    "submitted_by",
-                ):
-                    value = question.get(field_name)
-                    if value in (None, ""):
-                        continue
-                    lines.append(f"  {field_name} = {self._format_toml_value(value)}")
+                lines += self._format_question_lines(question)
             lines.append("")
 
         content = "\n".join(lines).strip() + "\n"
         path.write_text(content, encoding="utf-8")
 
-        # Force reload to pick up the new data
-        self.reload(force=True)
-        trivia_set = self.get_trivia_set(clean_key)
-        if trivia_set is None:
-            raise RuntimeError("Failed to reload trivia set after submission")
-        for question in trivia_set.questions:
-            if question.id == new_question["id"]:
-                return question
-        raise RuntimeError("Submitted question not found after reload")
+    def _index_submitted_file(self, data: Dict[str, Any]) -> None:
+        """Record which sets the submitted file holds and which one it ends with."""
+
+        counts: Dict[str, int] = {}
+        last_key: Optional[str] = None
+        sets = data.get("sets") if isinstance(data, dict) else None
+        for entry in sets if isinstance(sets, list) else ():
+            if not isinstance(entry, dict):
+                continue
+            last_key = str(entry.get("key", "")).strip()
+            questions = entry.get("questions")
+            counts[last_key] = counts.get(last_key, 0) + (
+                len(questions) if isinstance(questions, list) else 0
+            )
+        self._submitted_question_counts = counts
+        self._submitted_last_key = last_key
+
+    @staticmethod
+    def _describe_new_set(set_entry: Dict[str, Any], base_set: TriviaSet) -> None:
+        set_entry.setdefault("title", base_set.title)
+        if base_set.description:
+            set_entry.setdefault("description", base_set.description)
+        set_entry.setdefault("reward", base_set.reward)
+
+    def _format_set_lines(self, entry: Dict[str, Any]) -> List[str]:
+        lines = ["[[sets]]"]
+        for field_name in ("key", "title", "description", "reward"):
+            value = entry.get(field_name)
+            if value is None:
+                continue
+            lines.append(f"{field_name} = {self._format_toml_value(value)}")
+        return lines
+
+    def _format_question_lines(self, question: Dict[str, Any]) -> List[str]:
+        lines = ["", "  [[sets.questions]]"]
+        for field_name in (
+            "id",
+            "prompt",
+            "choices",
+            "answer",
+            "image",
+            "explanation",
+            "submitted_by",
+        ):
+            value = question.get(field_name)
+            if value in (None, ""):
+                continue
+            lines.append(f"  {field_name} = {self._format_toml_value(value)}")
+        return lines
 
     @staticmethod
     def _format_toml_value(value: Any) -> str:
-        if isinstance(value, str):
-            escaped = value.replace("\\", "\\\\").replace("\"", "\\\"")
-            return f'"{escaped}"'
         if isinstance(value, bool):
             return "true" if value else "false"
         if isinstance(value, (int, float)):
-            return f"{value}"
-        if isinstance(value, list):
-            return json.dumps(value, ensure_ascii=False)
-        return json.dumps(value, ensure_ascii=False)
+            return repr(value)
+        # JSON strings (and arrays of them) are valid TOML once DEL is escaped;
+        # this also covers newlines and other control characters in prompts.
+        return json.dumps(value, ensure_ascii=False).replace("\x7f", "\\u007f")
 
     @staticmethod
     def _coerce_enabled(value: Any) -> bool:
@@ -468,9 +673,9 @@ class GamesManager:
         return bool(value)
 
     @staticmethod
-    def _get_mtime(path: Path) -> Optional[float]:
+    def _get_mtime(path: str) -> Optional[float]:
         try:
-            return path.stat().st_mtime
+            return os.stat(path).st_mtime
         except FileNotFoundError:
             return None
 
@@ -482,20 +687,27 @@ class GamesManager:
     # ------------------------------------------------------------------
     # Trivia helpers
     def get_trivia_set(self, key: str) -> Optional[TriviaSet]:
-        self._ensure_current()
+        # Throttle check inlined from _ensure_current; these lookups run on every request.
+        if (
+            not self._loaded
+            or time.monotonic() - self._last_check_monotonic >= self._recheck_interval
+        ):
+            self._ensure_current()
         return self._trivia_sets.get(key)
 
     # ------------------------------------------------------------------
     # Game helpers
     def list_games(self) -> List[GameDefinition]:
+        """Return the enabled games by name. The list is shared; callers must not mutate it."""
         self._ensure_current()
-        return sorted(
-            (game for game in self._games.values() if game.enabled),
-            key=lambda game: game.name.lower(),
-        )
+        return self._enabled_sorted_games
 
     def get_game(self, key: str) -> Optional[GameDefinition]:
-        self._ensure_current()
+        if (
+            not self._loaded
+            or time.monotonic() - self._last_check_monotonic >= self._recheck_interval
+        ):
+            self._ensure_current()
         game = self._games.get(key)
         if game is None or not game.enabled:
             return None
@@ -506,10 +718,10 @@ class GamesManager:
     def create_token(self, payload: Dict[str, Any]) -> str:
         payload = dict(payload)
         payload.setdefault("_ts", time.time())
-        return self._serializer.dumps(payload)
+        return self._dumps(payload)
 
     def load_token(self, token: str) -> Dict[str, Any]:
-        data = self._serializer.loads(token)
+        data = self._loads(token)
         if not isinstance(data, dict):
             raise BadSignature("Invalid token payload")
         return data
@@ -539,6 +751,8 @@ def get_games_manager() -> GamesManager:
 def init_games(app) -> None:
     """Initialize the games manager during application startup."""
 
+    if isinstance(app.extensions.get("games_manager"), GamesManager):
+        return
     config_dir = Path(app.root_path) / "config"
     manager = GamesManager(
         app,
@@ -444,6 +444,19 @@ class AppSetting(db.Model):
             # Table may not exist yet; return default
             return default
 
+    @staticmethod
+    def get_many(keys: list[str], *, strict: bool = False) -> dict[str, str]:
+        if not keys:
+            return {}
+        try:
+            rows = AppSetting.query.filter(AppSetting.key.in_(keys)).all()
+        except Exception:
+            if strict:
+                raise
+            # Table may not exist yet; treat every key as unset
+            return {}
+        return {row.key: row.value for row in rows}
+
     @staticmethod
     def set(key: str, value: str) -> None:
         try:
@@ -460,6 +473,28 @@ class AppSetting(db.Model):
             setting.updated_at = datetime.utcnow()
         db.session.commit()
 
+    @staticmethod
+    def set_many(values: dict[str, str]) -> None:
+        if not values:
+            return
+        keys = list(values)
+        try:
+            existing = AppSetting.query.filter(AppSetting.key.in_(keys)).all()
+        except Exception:
+            # Attempt to create missing tables and retry once
+            db.create_all()
+            existing = AppSetting.query.filter(AppSetting.key.in_(keys)).all()
+        by_key = {setting.key: setting for setting in existing}
+        now = datetime.utcnow()
+        for key, value in values.items():
+            setting = by_key.get(key)
+            if setting is None:
+                db.session.add(AppSetting(key=key, value=value, updated_at=now))
+            else:
+                setting.value = value
+                setting.updated_at = now
+        db.session.commit()
+
     @staticmethod
     def delete(key: str) -> None:
         try:
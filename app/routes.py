@@ -1245,7 +1245,7 @@ def _handle_trivia_game(game, manager):
                     token_order = int(payload.get("order"))
                 except (TypeError, ValueError):
                     token_order = None
-                expected_order = int(selected_question.hash_value, 16) ^ user_hash
+                expected_order = selected_question.hash_int ^ user_hash
                 if question_id != selected_question.id or token_order != expected_order:
                     result = {
                         "category": "error",
@@ -1314,7 +1314,7 @@ def _handle_trivia_game(game, manager):
         return render_template("games/trivia_complete.html", game=game, result=result)
 
     if selected_order is None:
-        selected_order = int(selected_question.hash_value, 16) ^ user_hash
+        selected_order = selected_question.hash_int ^ user_hash
 
     token_payload = {
         "game": game.key,
@@ -539,6 +539,9 @@ def _parse_toml_value(value: str):
 # Application helper
 
 def init_market(app) -> MarketSimulator:
+    existing = getattr(app, "market_simulator", None)
+    if existing is not None:
+        return existing
     config_path = Path(app.root_path) / "config" / "securities.toml"
     simulator = MarketSimulator(app, config_path)
     simulator.ensure_initialized()
@@ -1,6 +1,8 @@
+import contextlib
 import importlib.util
 import sys
 import threading
+import types
 from datetime import datetime, timedelta
 from pathlib import Path
 
@@ -19,14 +21,20 @@ def make_manager(config_path):
     manager = object.__new__(CasinoManager)
     manager.app = None
     manager.config_path = config_path
-    manager._lock = threading.Lock()
     manager._thread = None
     manager._stop = threading.Event()
+    manager._publish_now = threading.Event()
+    manager._publish_done = threading.Condition()
+    manager._forced_requested = 0
+    manager._forced_served = 0
+    manager._forced_summary = None
+    manager._forced_error = None
     manager.slots = {}
     manager.blackjack_min_bet = 5.0
     manager.blackjack_max_bet = 250.0
     manager.blackjack_payout = 1.5
     manager._pending_profit = 0.0
+    manager._pending_dirty = False
     manager._last_publish = None
     manager.reload_config()
     return manager
@@ -123,3 +131,107 @@ def test_should_publish_based_on_interval(tmp_path):
 
     manager._last_publish = now - manager.publish_interval
     assert manager._should_publish(now) is True
+
+
+def test_reload_config_reuses_cache_until_file_changes(tmp_path):
+    config_path = tmp_path / "casino.toml"
+    config_path.write_text('[slots.nova]\nname = "First"\n')
+
+    manager = make_manager(config_path)
+    first = manager.get_slot("nova")
+    manager.reload_config()
+    assert manager.get_slot("nova") is first
+
+    config_path.write_text('[slots.nova]\nname = "Second Name"\n')
+    manager.reload_config()
+    assert manager.get_slot("nova").name == "Second Name"
+
+
+def test_seconds_until_next_publish_tracks_deadline(tmp_path):
+    config_path = tmp_path / "casino.toml"
+    config_path.write_text("")
+
+    manager = make_manager(config_path)
+
+    manager._last_publish = None
+    assert manager._seconds_until_next_publish() == pytest.approx(60.0)
+
+    manager._last_publish = datetime.utcnow()
+    remaining = manager._seconds_until_next_publish()
+    assert remaining == pytest.approx(manager.publish_interval.total_seconds(), abs=5)
+
+    manager._last_publish = datetime.utcnow() - 2 * manager.publish_interval
+    assert manager._seconds_until_next_publish() == pytest.approx(30.0)
+
+
+def test_forced_publish_runs_on_background_thread(tmp_path, monkeypatch):
+    config_path = tmp_path / "casino.toml"
+    config_path.write_text("")
+
+    manager = make_manager(config_path)
+    manager.app = types.SimpleNamespace(app_context=contextlib.nullcontext)
+    publishers = []
+
+    def fake_publish(now):
+        publishers.append(threading.current_thread().name)
+        manager._last_publish = now
+        return f"published #{len(publishers)}"
+
+    monkeypatch.setattr(manager, "_publish_earnings", fake_publish)
+    manager.start()
+    try:
+        summary = manager.publish_earnings_if_due(force=True)
+    finally:
+        manager.stop()
+
+    assert summary is not None and summary.startswith("published")
+    assert publishers and set(publishers) == {"casino-manager"}
+
+
+def test_add_card_counts_aces_low_only_when_needed():
+    total, aces = casino._add_card(0, 0, "A")
+    total, aces = casino._add_card(total, aces, "A")
+    assert (total, aces) == (12, 1)
+
+    total, aces = casino._add_card(total, aces, "K")
+    assert (total, aces) == (12, 0)
+
+    total, aces = casino._add_card(total, aces, "9")
+    assert (total, aces) == (21, 0)
+
+
+def test_pending_profit_stays_in_memory_until_flushed(tmp_path, monkeypatch):
+    config_path = tmp_path / "casino.toml"
+    config_path.write_text("")
+
+    manager = make_manager(config_path)
+    manager.app = types.SimpleNamespace(app_context=contextlib.nullcontext)
+    writes = []
+    monkeypatch.setattr(
+        manager, "_set_setting", lambda key, value, commit=False: writes.append((key, value, commit))
+    )
+
+    manager._set_pending_profit(12.5)
+    manager._set_pending_profit(20.0)
+    assert writes == []
+    assert manager._pending_profit == 20.0
+
+    manager.stop()
+    assert writes == [(casino.PENDING_KEY, "20.000000", True)]
+
+    manager.stop()
+    assert len(writes) == 1
+
+
+def test_forced_slot_win_matches_full_grid_evaluation(tmp_path, monkeypatch):
+    config_path = tmp_path / "casino.toml"
+    config_path.write_text("")
+
+    manager = make_manager(config_path)
+    slot = manager.get_slot("nova")
+    monkeypatch.setattr(casino.random, "random", lambda: 0.0)
+
+    for _ in range(50):
+        result = manager.play_slot("nova", 10.0)
+        assert result.wins
+        assert result.wins == manager._evaluate_slot_grid(result.reels, slot.prize_lookup, 10.0)
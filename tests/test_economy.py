@@ -0,0 +1,293 @@
+import importlib.util
+import os
+import sys
+import types
+from pathlib import Path
+
+import pytest
+
+_module_path = Path(__file__).resolve().parents[1] / "app" / "economy.py"
+_spec = importlib.util.spec_from_file_location("app.economy", _module_path)
+economy = importlib.util.module_from_spec(_spec)
+sys.modules.setdefault("app.economy", economy)
+assert _spec and _spec.loader
+_spec.loader.exec_module(economy)
+EconomyManager = economy.EconomyManager
+
+
+class FakeAppSetting:
+    """In-memory stand-in for the AppSetting model that counts lookups."""
+
+    store: dict = {}
+    lookups: list = []
+    writes: list = []
+
+    @classmethod
+    def get(cls, key, default=None):
+        cls.lookups.append([key])
+        return cls.store.get(key, default)
+
+    @classmethod
+    def get_many(cls, keys, *, strict=False):
+        cls.lookups.append(list(keys))
+        return {key: cls.store[key] for key in keys if key in cls.store}
+
+    @classmethod
+    def set(cls, key, value):
+        cls.store[key] = value
+
+    @classmethod
+    def set_many(cls, values):
+        cls.writes.append(dict(values))
+        cls.store.update(values)
+
+
+@pytest.fixture
+def fake_settings(monkeypatch):
+    FakeAppSetting.store = {}
+    FakeAppSetting.lookups = []
+    FakeAppSetting.writes = []
+    monkeypatch.setattr(economy, "_AppSetting", FakeAppSetting)
+    return FakeAppSetting
+
+
+def test_missing_config_is_written_with_defaults(tmp_path):
+    config_path = tmp_path / "config" / "economy.toml"
+    manager = EconomyManager(config_path=config_path)
+
+    config = manager.get_config()
+
+    assert config_path.exists()
+    assert config["pricing"]["purchase_impact"] == pytest.approx(0.0125)
+    assert list(config["payouts"]["tracked_games"]) == ["single_player", "prisoners"]
+
+
+def test_config_file_is_rechecked_only_after_ttl_or_forced_reload(tmp_path):
+    config_path = tmp_path / "economy.toml"
+    config_path.write_text("[pricing]\nmin_price = 0.5\n")
+    manager = EconomyManager(config_path=config_path)
+    assert manager.get_config()["pricing"]["min_price"] == pytest.approx(0.5)
+
+    config_path.write_text("[pricing]\nmin_price = 0.75\n")
+    stat = config_path.stat()
+    os.utime(config_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 5_000_000_000))
+    assert manager.get_config()["pricing"]["min_price"] == pytest.approx(0.5)
+
+    manager.force_reload()
+    assert manager.get_config()["pricing"]["min_price"] == pytest.approx(0.75)
+
+
+def test_failed_config_write_leaves_current_config_untouched(tmp_path, monkeypatch):
+    config_path = tmp_path / "economy.toml"
+    manager = EconomyManager(config_path=config_path)
+    manager.get_config()
+
+    def fail_render(config):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(economy, "_render_config", fail_render)
+    with pytest.raises(OSError):
+        manager.update_config(pricing={"min_price": 3.0})
+
+    assert manager.get_config()["pricing"]["min_price"] == pytest.approx(0.1)
+
+
+def test_game_multipliers_are_resolved_in_one_lookup(tmp_path, fake_settings):
+    manager = EconomyManager(config_path=tmp_path / "economy.toml")
+    fake_settings.store = {
+        "economy:game:single_player:multiplier": "1.5",
+        "economy:game:prisoners:multiplier": "not-a-number",
+    }
+
+    multipliers = manager.get_game_multipliers()
+
+    assert multipliers == {"single_player": pytest.approx(1.5), "prisoners": pytest.approx(1.0)}
+    assert fake_settings.lookups == [
+        [
+            "economy:game:single_player:multiplier",
+            "economy:game:prisoners:multiplier",
+        ]
+    ]
+
+    assert manager.get_game_multipliers() == multipliers
+    assert len(fake_settings.lookups) == 1
+
+
+def test_record_game_payout_cools_primary_and_recovers_others(tmp_path, fake_settings):
+    manager = EconomyManager(config_path=tmp_path / "economy.toml")
+
+    manager.record_game_payout(4.0, game_key="single_player")
+
+    store = fake_settings.store
+    assert float(store["economy:game:single_player:multiplier"]) < 1.0
+    assert float(store["economy:game:prisoners:multiplier"]) > 1.0
+    assert len(fake_settings.lookups) == 2
+
+
+def test_product_liquidity_uses_precomputed_overrides(tmp_path):
+    config_path = tmp_path / "economy.toml"
+    config_path.write_text(
+        "[pricing]\ndefault_liquidity = 50.0\n\n"
+        "[pricing.liquidity_overrides]\n7 = 0.0\ncoffee = 25.0\n"
+    )
+    manager = EconomyManager(config_path=config_path)
+    pricing = manager._current_pricing()
+
+    def product(product_id, name, base_stock=None):
+        return types.SimpleNamespace(id=product_id, name=name, base_stock=base_stock)
+
+    assert manager._product_liquidity(product(7, "Tea"), pricing) == pytest.approx(1e-6)
+    assert manager._product_liquidity(product(8, "Coffee"), pricing) == pytest.approx(25.0)
+    assert manager._product_liquidity(product(9, "Cake", base_stock=12), pricing) == 12.0
+    assert manager._product_liquidity(product(10, "Pie"), pricing) == pytest.approx(50.0)
+
+    manager.update_config(pricing={"liquidity_overrides": {"10": 5.0}})
+    pricing = manager._current_pricing()
+    assert manager._product_liquidity(product(10, "Pie"), pricing) == pytest.approx(5.0)
+
+
+def test_newly_tracked_games_are_written_on_flush(tmp_path, fake_settings):
+    config_path = tmp_path / "economy.toml"
+    manager = EconomyManager(config_path=config_path)
+    manager.get_config()
+
+    assert manager.activate_game_context("trivia") == pytest.approx(1.0)
+    assert "trivia" in manager.get_config()["payouts"]["tracked_games"]
+    assert "trivia" not in config_path.read_text()
+
+    manager.flush_config()
+    assert 'tracked_games = ["single_player", "prisoners", "trivia"]' in config_path.read_text()
+
+
+def test_render_config_round_trips_through_toml():
+    config = economy._default_config()
+    config["pricing"]["liquidity_overrides"] = {"7": 12.5}
+    config["payouts"]["tracked_games"] = ["single_player", 'quote"game']
+
+    parsed = economy.tomllib.loads(economy._render_config(config))
+
+    assert parsed["pricing"]["purchase_impact"] == pytest.approx(0.0125)
+    assert parsed["pricing"]["liquidity_overrides"] == {"7": 12.5}
+    assert parsed["payouts"]["tracked_games"] == ["single_player", 'quote"game']
+
+
+def test_quote_purchase_prices_compound_and_clamp(tmp_path):
+    config_path = tmp_path / "economy.toml"
+    config_path.write_text("[pricing]\nmax_price = 13.0\n")
+    manager = EconomyManager(config_path=config_path)
+    product = types.SimpleNamespace(id=1, name="Widget", price=10.0, base_stock=None)
+
+    assert manager.quote_purchase_prices(product, 4) == [10.0, 11.25, 12.6562, 13.0]
+    assert manager.quote_purchase_prices(product, 6) == [10.0, 11.25, 12.6562, 13.0, 13.0, 13.0]
+    assert manager.quote_purchase_prices(product, 0) == []
+
+
+def test_multiplier_cache_is_written_through_and_cleared_on_reload(tmp_path, fake_settings):
+    manager = EconomyManager(config_path=tmp_path / "economy.toml")
+
+    manager.record_game_payout(4.0, game_key="single_player")
+    lookups = len(fake_settings.lookups)
+    multipliers = manager.get_game_multipliers()
+    assert len(fake_settings.lookups) == lookups
+    assert multipliers["single_player"] == pytest.approx(
+        float(fake_settings.store["economy:game:single_player:multiplier"])
+    )
+
+    fake_settings.store["economy:game:single_player:multiplier"] = "2.0"
+    manager.force_reload()
+    assert manager.get_game_multiplier("single_player") == pytest.approx(2.0)
+
+
+def test_cross_recovery_writes_all_multipliers_at_once(tmp_path, fake_settings):
+    config_path = tmp_path / "economy.toml"
+    config_path.write_text(
+        '[payouts]\ntracked_games = ["dice", "cards", "trivia"]\n\n'
+        "[payouts.liquidity_overrides]\ntrivia = 2.0\n"
+    )
+    manager = EconomyManager(config_path=config_path)
+
+    manager.record_game_payout(4.0, game_key="dice")
+
+    assert fake_settings.writes == [
+        {
+            "economy:game:cards:multiplier": "1.008000",
+            "economy:game:trivia:multiplier": "1.002000",
+        }
+    ]
+    assert manager.get_game_multipliers()["trivia"] == pytest.approx(1.002)
+
+
+def test_tracked_game_set_follows_config(tmp_path, fake_settings):
+    manager = EconomyManager(config_path=tmp_path / "economy.toml")
+
+    manager.record_game_payout(1.0, game_key="dice")
+    manager.record_game_payout(1.0, game_key="dice")
+
+    tracked = manager.get_config()["payouts"]["tracked_games"]
+    assert manager._tracked_games_set == frozenset(tracked)
+    assert list(tracked).count("dice") == 1
+    assert manager._pending_tracked == ["dice"]
+
+
+def test_payout_params_follow_config_updates(tmp_path, fake_settings):
+    manager = EconomyManager(config_path=tmp_path / "economy.toml")
+    fake_settings.store["economy:game:dice:multiplier"] = "9.5"
+
+    manager.update_config(payouts={"max_multiplier": 3.0, "baseline_multiplier": 1.5})
+
+    assert manager._current_payouts().max_multiplier == 3.0
+    assert manager.get_game_multiplier("dice") == pytest.approx(3.0)
+    assert manager.get_game_multiplier("cards") == pytest.approx(1.5)
+
+
+def test_multiplier_write_through_wins_over_concurrent_fill(tmp_path, fake_settings, monkeypatch):
+    manager = EconomyManager(config_path=tmp_path / "economy.toml")
+    payouts = manager._current_payouts()
+    original_get_many = fake_settings.get_many.__func__
+
+    def racing_get_many(cls, keys, *, strict=False):
+        result = original_get_many(cls, keys, strict=strict)
+        # A payout writes through between the database read and the cache fill.
+        monkeypatch.setattr(fake_settings, "get_many", classmethod(original_get_many))
+        manager._set_game_multiplier("dice", 0.5, payouts, current=1.0)
+        return result
+
+    monkeypatch.setattr(fake_settings, "get_many", classmethod(racing_get_many))
+
+    manager.get_game_multiplier("dice")
+
+    assert manager._multiplier_cache["dice"] == "0.500000"
+    assert manager.get_game_multiplier("dice") == pytest.approx(0.5)
+
+
+def test_unreadable_settings_are_not_cached(tmp_path, fake_settings, monkeypatch):
+    manager = EconomyManager(config_path=tmp_path / "economy.toml")
+    fake_settings.store["economy:game:dice:multiplier"] = "2.0"
+
+    def failing_get_many(keys, *, strict=False):
+        raise RuntimeError("no such table")
+
+    monkeypatch.setattr(fake_settings, "get_many", failing_get_many)
+    assert manager.get_game_multiplier("dice") == pytest.approx(1.0)
+    assert "dice" not in manager._multiplier_cache
+
+    monkeypatch.undo()
+    monkeypatch.setattr(economy, "_AppSetting", fake_settings)
+    assert manager.get_game_multiplier("dice") == pytest.approx(2.0)
+
+
+def test_multiplier_writes_do_not_wait_on_config_lock(tmp_path, fake_settings):
+    import threading
+
+    manager = EconomyManager(config_path=tmp_path / "economy.toml")
+    payouts = manager._current_payouts()
+    done = threading.Event()
+
+    with manager._lock:
+        writer = threading.Thread(
+            target=lambda: (manager._set_game_multiplier("dice", 0.5, payouts, current=1.0), done.set())
+        )
+        writer.start()
+        assert done.wait(2)
+    writer.join()
+    assert fake_settings.store["economy:game:dice:multiplier"] == "0.500000"
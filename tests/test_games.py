@@ -37,7 +37,7 @@ def _build_manager(
     _write_with_new_mtime(trivia_path, trivia_content)
     _write_with_new_mtime(submitted_path, submitted_content)
     app = types.SimpleNamespace(
-        config={"SECRET_KEY": "test"},
+        config={"SECRET_KEY": "test", "GAMES_RECHECK_INTERVAL": 0, "GAMES_HOT_RELOAD": True},
         root_path=str(tmp_path),
         extensions={},
         logger=DummyLogger(),
@@ -229,3 +229,408 @@ reward = 6.0
     )
     merged_questions = manager.get_trivia_set("quiz").questions
     assert any(question.prompt == "Another?" for question in merged_questions)
+
+
+def test_force_reload_reuses_unchanged_parse(tmp_path, monkeypatch):
+    import app.games as games_module
+
+    manager = _build_manager(
+        tmp_path,
+        """
+[[games]]
+key = "alpha"
+name = "Alpha"
+type = "reaction"
+""",
+        """
+[[sets]]
+key = "quiz"
+title = "Quiz"
+
+  [[sets.questions]]
+  id = "q1"
+  prompt = "Q1?"
+  choices = ["a", "b"]
+""",
+    )
+    manager.list_games()
+    parsed: list[Path] = []
+    original_load = games_module._load_toml
+
+    def counting_load(path):
+        parsed.append(path)
+        return original_load(path)
+
+    monkeypatch.setattr(games_module, "_load_toml", counting_load)
+
+    quiz = manager.get_trivia_set("quiz")
+    manager.reload(force=True)
+    assert parsed == []
+    assert manager.get_trivia_set("quiz") is quiz
+
+    manager.append_submitted_question("quiz", {"prompt": "New?", "choices": ["x", "y"]})
+    assert parsed == []
+    assert [game.key for game in manager.list_games()] == ["alpha"]
+    assert [question.id for question in manager.get_trivia_set("quiz").questions] == [
+        "q1",
+        "quiz-submitted-0",
+    ]
+
+
+def test_ordered_pairs_use_parsed_hash(tmp_path):
+    manager = _build_manager(
+        tmp_path,
+        "",
+        """
+[[sets]]
+key = "quiz"
+title = "Quiz"
+
+  [[sets.questions]]
+  id = "q1"
+  prompt = "Q1?"
+  choices = ["a", "b"]
+
+  [[sets.questions]]
+  id = "q2"
+  prompt = "Q2?"
+  choices = ["c", "d"]
+""",
+    )
+    trivia_set = manager.get_trivia_set("quiz")
+    user_hash = 0x5A5A
+
+    pairs = trivia_set.ordered_pairs_for_user(user_hash)
+
+    expected = sorted(
+        (int(question.hash_value, 16) ^ user_hash, question.id) for question in trivia_set.questions
+    )
+    assert [(order, question.id) for order, question in pairs] == expected
+
+
+def test_question_hash_matches_joined_seed(tmp_path):
+    import hashlib
+
+    manager = _build_manager(
+        tmp_path,
+        "",
+        """
+[[sets]]
+key = "quiz"
+title = "Quiz"
+
+  [[sets.questions]]
+  id = "q1"
+  prompt = "Qué?"
+  choices = ["a", "b"]
+  answer = 1
+  explanation = "Because"
+""",
+    )
+    question = manager.get_trivia_set("quiz").questions[0]
+
+    seed = "::".join(["quiz", "q1", "Qué?", "a|b", "1", "", "Because", ""]).encode("utf-8")
+    assert question.hash_value == hashlib.sha256(seed).hexdigest()
+
+
+def test_submitted_question_with_control_characters_round_trips(tmp_path):
+    manager = _build_manager(tmp_path, "", "")
+
+    question = manager.append_submitted_question(
+        "quiz",
+        {"prompt": 'Line one\nsaid "hi" \\ bye', "choices": ["a\tb", "c\x7f"], "answer": 1},
+    )
+
+    assert question.prompt == 'Line one\nsaid "hi" \\ bye'
+    manager.reload(force=True)
+    reloaded = manager.get_trivia_set("quiz").questions[0]
+    assert reloaded.choices == ("a\tb", "c\x7f")
+    assert reloaded.answer == 1
+
+
+def test_submissions_append_without_rewriting_file(tmp_path):
+    manager = _build_manager(
+        tmp_path,
+        "",
+        """
+[[sets]]
+key = "quiz"
+title = "Quiz"
+reward = 2.0
+
+  [[sets.questions]]
+  id = "q1"
+  prompt = "Q1?"
+  choices = ["a", "b"]
+""",
+    )
+    submitted_path = Path(manager.submitted_trivia_path)
+
+    first = manager.append_submitted_question("quiz", {"prompt": "First?", "choices": ["a", "b"]})
+    before = submitted_path.read_text()
+    manager.append_submitted_question("other", {"prompt": "Other?", "choices": ["c", "d"]})
+    second = manager.append_submitted_question(
+        "quiz", {"prompt": "Second?", "choices": ["e", "f"], "submitted_by": "me@example.com"}
+    )
+
+    assert submitted_path.read_text().startswith(before)
+    quiz = manager.get_trivia_set("quiz")
+    assert quiz.title == "Quiz"
+    assert [question.id for question in quiz.questions] == [
+        "q1",
+        "quiz-submitted-0",
+        "quiz-submitted-1",
+    ]
+    assert [question.id for question in manager.get_trivia_set("other").questions] == [
+        "other-submitted-0"
+    ]
+
+    manager.reload(force=True)
+    reloaded = manager.get_trivia_set("quiz").questions
+    assert [question.prompt for question in reloaded] == ["Q1?", "First?", "Second?"]
+    assert reloaded[1:] == (first, second)
+
+
+def test_config_checks_are_throttled(tmp_path):
+    manager = _build_manager(
+        tmp_path,
+        """
+[[games]]
+key = "alpha"
+name = "Alpha"
+type = "reaction"
+""",
+        "",
+    )
+    manager.list_games()
+    manager._recheck_interval = 60.0
+    manager._last_check_monotonic = time.monotonic()
+
+    _write_with_new_mtime(
+        Path(manager.games_path),
+        """
+[[games]]
+key = "beta"
+name = "Beta"
+type = "reaction"
+""",
+    )
+    assert [game.key for game in manager.list_games()] == ["alpha"]
+
+    manager.reload(force=True)
+    assert [game.key for game in manager.list_games()] == ["beta"]
+
+
+def test_checks_skip_while_another_thread_reloads(tmp_path):
+    import threading
+
+    manager = _build_manager(tmp_path, "", "")
+    manager.list_games()
+    _write_with_new_mtime(
+        Path(manager.games_path),
+        """
+[[games]]
+key = "alpha"
+name = "Alpha"
+type = "reaction"
+""",
+    )
+    acquired = threading.Event()
+    release = threading.Event()
+
+    def hold_lock():
+        with manager._reload_lock:
+            acquired.set()
+            release.wait(5)
+
+    holder = threading.Thread(target=hold_lock)
+    holder.start()
+    acquired.wait(5)
+    try:
+        assert manager.list_games() == []
+    finally:
+        release.set()
+        holder.join()
+    assert [game.key for game in manager.list_games()] == ["alpha"]
+
+
+def test_submission_only_rebuilds_its_own_set(tmp_path):
+    manager = _build_manager(
+        tmp_path,
+        "",
+        """
+[[sets]]
+key = "quiz"
+title = "Quiz"
+
+  [[sets.questions]]
+  id = "q1"
+  prompt = "Q1?"
+  choices = ["a", "b"]
+
+[[sets]]
+key = "other"
+title = "Other"
+
+  [[sets.questions]]
+  id = "o1"
+  prompt = "O1?"
+  choices = ["a", "b"]
+""",
+    )
+    other = manager.get_trivia_set("other")
+    base_quiz = manager._base_trivia_sets["quiz"]
+
+    manager.append_submitted_question("quiz", {"prompt": "New?", "choices": ["x", "y"]})
+
+    assert manager.get_trivia_set("other") is other
+    assert [question.id for question in base_quiz.questions] == ["q1"]
+    assert [question.id for question in manager.get_trivia_set("quiz").questions] == [
+        "q1",
+        "quiz-submitted-0",
+    ]
+
+
+def test_hot_reload_disabled_still_sees_submissions(tmp_path):
+    manager = _build_manager(
+        tmp_path,
+        """
+[[games]]
+key = "alpha"
+name = "Alpha"
+type = "reaction"
+""",
+        "",
+    )
+    manager.list_games()
+    manager._hot_reload = False
+
+    _write_with_new_mtime(
+        Path(manager.games_path),
+        """
+[[games]]
+key = "beta"
+name = "Beta"
+type = "reaction"
+""",
+    )
+    _write_with_new_mtime(
+        Path(manager.submitted_trivia_path),
+        """
+[[sets]]
+key = "quiz"
+
+  [[sets.questions]]
+  id = "s1"
+  prompt = "From another worker?"
+  choices = ["a", "b"]
+""",
+    )
+
+    assert [game.key for game in manager.list_games()] == ["alpha"]
+    assert [question.id for question in manager.get_trivia_set("quiz").questions] == ["s1"]
+
+    manager.reload(force=True)
+    assert [game.key for game in manager.list_games()] == ["beta"]
+
+
+def test_config_is_loaded_on_first_lookup(tmp_path, monkeypatch):
+    import app.games as games_module
+
+    parsed: list[Path] = []
+    original_load = games_module._load_toml
+
+    def counting_load(path):
+        parsed.append(path)
+        return original_load(path)
+
+    monkeypatch.setattr(games_module, "_load_toml", counting_load)
+    manager = _build_manager(
+        tmp_path,
+        """
+[[games]]
+key = "alpha"
+name = "Alpha"
+type = "reaction"
+""",
+        "",
+    )
+    assert parsed == []
+
+    assert manager.get_game("alpha").name == "Alpha"
+    assert len(parsed) == 3
+
+
+def test_lookups_wait_for_first_load_in_another_thread(tmp_path, monkeypatch):
+    import threading
+
+    import app.games as games_module
+
+    manager = _build_manager(
+        tmp_path,
+        """
+[[games]]
+key = "alpha"
+name = "Alpha"
+type = "reaction"
+""",
+        """
+[[sets]]
+key = "quiz"
+
+  [[sets.questions]]
+  id = "q1"
+  prompt = "Q1?"
+  choices = ["a", "b"]
+""",
+    )
+    manager._recheck_interval = 60.0
+    loading = threading.Event()
+    resume = threading.Event()
+    original_load = games_module._load_toml
+
+    def slow_load(path):
+        loading.set()
+        resume.wait(5)
+        return original_load(path)
+
+    monkeypatch.setattr(games_module, "_load_toml", slow_load)
+    loader = threading.Thread(target=manager.list_games)
+    loader.start()
+    loading.wait(5)
+
+    results = {}
+
+    def lookup():
+        results["game"] = manager.get_game("alpha")
+        results["set"] = manager.get_trivia_set("quiz")
+
+    reader = threading.Thread(target=lookup)
+    reader.start()
+    reader.join(0.2)
+    resume.set()
+    loader.join(5)
+    reader.join(5)
+
+    assert results["game"] is not None and results["game"].key == "alpha"
+    assert results["set"] is not None and results["set"].key == "quiz"
+
+
+def test_rewrite_after_external_change_keeps_submitted_ids_unique(tmp_path):
+    manager = _build_manager(tmp_path, "", "")
+    submitted_path = Path(manager.submitted_trivia_path)
+
+    manager.append_submitted_question("quiz", {"prompt": "A?", "choices": ["a", "b"]})
+    manager.append_submitted_question("other", {"prompt": "B?", "choices": ["a", "b"]})
+    manager.append_submitted_question("quiz", {"prompt": "C?", "choices": ["a", "b"]})
+    # Another worker touches the file, so the next submission rewrites it in full.
+    _write_with_new_mtime(submitted_path, submitted_path.read_text())
+    manager.append_submitted_question("quiz", {"prompt": "D?", "choices": ["a", "b"]})
+
+    manager.reload(force=True)
+    assert [(question.id, question.prompt) for question in manager.get_trivia_set("quiz").questions] == [
+        ("quiz-submitted-0", "A?"),
+        ("quiz-submitted-1", "C?"),
+        ("quiz-submitted-2", "D?"),
+    ]
+    assert submitted_path.read_text().count('key = "quiz"') == 1